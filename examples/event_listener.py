@@ -21,7 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from pumpdotfun_sdk import PumpDotFunSDK
 from pumpdotfun_sdk.types import PumpFunEventType
-from pumpdotfun_sdk.utils import format_sol_amount
+from pumpdotfun_sdk.utils import format_sol_amount, install_uvloop
 
 
 class EventTracker:
@@ -219,7 +219,7 @@ async def basic_event_listening_example():
         sdk.remove_event_listener(create_listener)
         sdk.remove_event_listener(trade_listener)
         sdk.remove_event_listener(complete_listener)
-        sdk.stop_event_listening()
+        await sdk.stop_event_listening()
         await sdk.close()
         
         # Final statistics
@@ -295,7 +295,7 @@ async def filtered_event_listening_example():
     finally:
         sdk.remove_event_listener(trade_listener)
         sdk.remove_event_listener(create_listener)
-        sdk.stop_event_listening()
+        await sdk.stop_event_listening()
         await sdk.close()
         
         # Report findings
@@ -367,7 +367,7 @@ async def event_analytics_example():
     finally:
         sdk.remove_event_listener(create_listener)
         sdk.remove_event_listener(trade_listener)
-        sdk.stop_event_listening()
+        await sdk.stop_event_listening()
         await sdk.close()
         
         # Display analytics
@@ -441,7 +441,7 @@ async def demonstrate_error_handling():
     
     finally:
         try:
-            sdk.stop_event_listening()
+            await sdk.stop_event_listening()
             await sdk.close()
         except:
             pass
@@ -453,6 +453,9 @@ if __name__ == "__main__":
     print("🎧 Starting Event Listening Examples")
     print("=" * 40)
     
+    # uvloop speeds up busy event streams; must be set before asyncio.run
+    install_uvloop()
+    
     # Run examples
     try:
         # Basic event listening
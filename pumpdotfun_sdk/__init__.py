@@ -5,6 +5,7 @@ A Python SDK for interacting with the PumpFun protocol on Solana.
 """
 
 from .client import PumpDotFunSDK
+from .websocket_hub import WebSocketHub
 from .types import (
     CreateTokenMetadata,
     PriorityFee,
@@ -13,7 +14,9 @@ from .types import (
     BackendType,
     CreateEvent,
     TradeEvent,
-    CompleteEvent
+    CompleteEvent,
+    BuyOrder,
+    SellOrder
 )
 
 __version__ = "1.0.0"
@@ -21,6 +24,7 @@ __author__ = "Manus AI"
 
 __all__ = [
     "PumpDotFunSDK",
+    "WebSocketHub",
     "CreateTokenMetadata",
     "PriorityFee",
     "TransactionResult",
@@ -28,6 +32,8 @@ __all__ = [
     "BackendType",
     "CreateEvent",
     "TradeEvent",
-    "CompleteEvent"
+    "CompleteEvent",
+    "BuyOrder",
+    "SellOrder"
 ]
 
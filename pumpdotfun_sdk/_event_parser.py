@@ -0,0 +1,159 @@
+"""
+Binary decoding of PumpFun program events.
+
+Anchor emits events as "Program data: <base64>" log lines holding an 8-byte
+discriminator (sha256("event:<Name>")[:8]) followed by the borsh-encoded
+event fields. Fixed-width runs are decoded with precompiled structs so each
+event costs a handful of C-level unpacks rather than a per-byte loop, and
+the parsers build the event dataclasses directly.
+"""
+
+import functools
+import hashlib
+import struct
+from typing import Optional, Tuple, Union
+
+from solana.publickey import PublicKey
+
+from .types import CreateEvent, TradeEvent, CompleteEvent
+
+DISCRIMINATOR_SIZE = 8
+
+
+def _discriminator(name: str) -> bytes:
+    """Anchor event discriminator for an event name."""
+    return hashlib.sha256(f"event:{name}".encode()).digest()[:DISCRIMINATOR_SIZE]
+
+
+CREATE_EVENT_DISCRIMINATOR = _discriminator("CreateEvent")
+TRADE_EVENT_DISCRIMINATOR = _discriminator("TradeEvent")
+COMPLETE_EVENT_DISCRIMINATOR = _discriminator("CompleteEvent")
+
+# borsh string length prefix
+_U32 = struct.Struct('<I')
+# CreateEvent tail: mint, bonding curve, user
+_CREATE_KEYS = struct.Struct('<32s32s32s')
+# CreateEvent extension in newer program versions: creator, timestamp
+_CREATE_EXTENSION = struct.Struct('<32sq')
+# TradeEvent: mint, sol amount, token amount, is buy, user, timestamp
+_TRADE_EVENT = struct.Struct('<32sQQ?32sq')
+# CompleteEvent: user, mint, bonding curve, timestamp
+_COMPLETE_EVENT = struct.Struct('<32s32s32sq')
+
+
+@functools.lru_cache(maxsize=4096)
+def _pk(key: Union[str, bytes]) -> PublicKey:
+    """
+    Build a PublicKey from raw bytes or a base58 string, memoized since keys
+    repeat across events. Shared by the binary and text event paths.
+    """
+    return PublicKey(key)
+
+
+def _read_string(payload: bytes, offset: int) -> Tuple[str, int]:
+    """Read a borsh string and return it with the next offset."""
+    (length,) = _U32.unpack_from(payload, offset)
+    start = offset + _U32.size
+    end = start + length
+    if end > len(payload):
+        raise ValueError("String exceeds payload")
+    return payload[start:end].decode("utf-8"), end
+
+
+def parse_create_event(payload: bytes) -> CreateEvent:
+    """
+    Decode a CreateEvent body.
+
+    Args:
+        payload: Event bytes after the discriminator
+
+    Returns:
+        Create event
+    """
+    name, offset = _read_string(payload, 0)
+    symbol, offset = _read_string(payload, offset)
+    uri, offset = _read_string(payload, offset)
+    mint, _, user = _CREATE_KEYS.unpack_from(payload, offset)
+    offset += _CREATE_KEYS.size
+
+    # Older program versions end after the user key and carry no timestamp
+    timestamp = 0
+    if len(payload) - offset >= _CREATE_EXTENSION.size:
+        _, timestamp = _CREATE_EXTENSION.unpack_from(payload, offset)
+
+    return CreateEvent(
+        mint=_pk(mint),
+        name=name,
+        symbol=symbol,
+        uri=uri,
+        user=_pk(user),
+        timestamp=timestamp
+    )
+
+
+def parse_trade_event(payload: bytes) -> TradeEvent:
+    """
+    Decode a TradeEvent body.
+
+    Args:
+        payload: Event bytes after the discriminator
+
+    Returns:
+        Trade event
+    """
+    mint, sol_amount, token_amount, is_buy, user, timestamp = _TRADE_EVENT.unpack_from(payload)
+
+    return TradeEvent(
+        mint=_pk(mint),
+        user=_pk(user),
+        is_buy=is_buy,
+        sol_amount=sol_amount,
+        token_amount=token_amount,
+        timestamp=timestamp
+    )
+
+
+def parse_complete_event(payload: bytes) -> CompleteEvent:
+    """
+    Decode a CompleteEvent body.
+
+    Args:
+        payload: Event bytes after the discriminator
+
+    Returns:
+        Complete event
+    """
+    user, mint, _, timestamp = _COMPLETE_EVENT.unpack_from(payload)
+
+    return CompleteEvent(
+        mint=_pk(mint),
+        user=_pk(user),
+        timestamp=timestamp
+    )
+
+
+_PARSERS = {
+    CREATE_EVENT_DISCRIMINATOR: parse_create_event,
+    TRADE_EVENT_DISCRIMINATOR: parse_trade_event,
+    COMPLETE_EVENT_DISCRIMINATOR: parse_complete_event,
+}
+
+
+def parse_event(data: bytes) -> Optional[Union[CreateEvent, TradeEvent, CompleteEvent]]:
+    """
+    Decode an Anchor event emitted by the PumpFun program.
+
+    Args:
+        data: Decoded "Program data:" bytes, discriminator included
+
+    Returns:
+        Event object, or None for other events or malformed data
+    """
+    parser = _PARSERS.get(data[:DISCRIMINATOR_SIZE])
+    if parser is None:
+        return None
+
+    try:
+        return parser(data[DISCRIMINATOR_SIZE:])
+    except (struct.error, ValueError):
+        return None
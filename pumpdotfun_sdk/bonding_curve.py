@@ -3,8 +3,8 @@ Bonding curve calculations for PumpDotFun SDK.
 """
 
 import math
-from typing import Dict, Any, Optional
-from .utils import PumpFunError
+from typing import Dict, Any, Optional, Iterable, List
+from .utils import PumpFunError, calculate_slippage_amount
 
 
 class BondingCurveCalculator:
@@ -58,6 +58,40 @@ class BondingCurveCalculator:
             
         return int(tokens_out)
     
+    @staticmethod
+    def get_buy_prices(
+        sol_amounts: Iterable[int],
+        real_sol_reserves: int,
+        real_token_reserves: int
+    ) -> List[int]:
+        """
+        Quote several buys against the same reserves.
+        
+        Equivalent to calling get_buy_price for each amount, with the
+        virtual reserves and constant product computed once.
+        
+        Args:
+            sol_amounts: Amounts of SOL to spend (in lamports)
+            real_sol_reserves: Current real SOL reserves
+            real_token_reserves: Current real token reserves
+            
+        Returns:
+            Amount of tokens to receive for each SOL amount
+        """
+        virtual_sol_reserves = BondingCurveCalculator.VIRTUAL_SOL_RESERVES + real_sol_reserves
+        virtual_token_reserves = BondingCurveCalculator.VIRTUAL_TOKEN_RESERVES + real_token_reserves
+        k = virtual_sol_reserves * virtual_token_reserves
+        
+        quotes = []
+        for sol_amount in sol_amounts:
+            if sol_amount <= 0:
+                raise PumpFunError("SOL amount must be positive")
+            tokens_out = virtual_token_reserves - k // (virtual_sol_reserves + sol_amount)
+            if tokens_out <= 0:
+                raise PumpFunError("Invalid token amount calculated")
+            quotes.append(tokens_out)
+        return quotes
+    
     @staticmethod
     def get_sell_price(
         token_amount: int,
@@ -172,14 +206,8 @@ class BondingCurveCalculator:
         Returns:
             Amount with slippage applied
         """
-        slippage_multiplier = slippage_basis_points / 10000
-        
-        if is_minimum:
-            # For minimum amounts (selling), reduce by slippage
-            return int(amount * (1 - slippage_multiplier))
-        else:
-            # For maximum amounts (buying), increase by slippage
-            return int(amount * (1 + slippage_multiplier))
+        # Minimum amounts (selling) are reduced, maximum amounts (buying) increased
+        return calculate_slippage_amount(amount, slippage_basis_points, is_minimum)
     
     @staticmethod
     def get_market_cap(
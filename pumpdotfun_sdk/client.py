@@ -3,14 +3,16 @@ Main client for PumpDotFun SDK.
 """
 
 import asyncio
+import base64
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import httpx
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
 from solana.transaction import Transaction, TransactionInstruction, AccountMeta
+from solders.signature import Signature
 from solana.system_program import (
     CreateAccountParams,
     TransferParams,
@@ -25,14 +27,18 @@ from .types import (
     TransactionResult,
     PumpFunEventType,
     BackendType,
+    BuyOrder,
+    SellOrder,
     EventCallback,
     DEFAULT_COMMITMENT,
-    DEFAULT_SLIPPAGE_BASIS_POINTS
+    DEFAULT_SLIPPAGE_BASIS_POINTS,
+    PUMP_FUN_PROGRAM_ID as _PUMP_FUN_PROGRAM_ID_STR
 )
 from .utils import (
     create_metadata_uri,
     validate_slippage,
     wait_for_confirmation,
+    wait_for_confirmations,
     calculate_slippage_amount,
     sol_to_lamports,
     TransactionError,
@@ -44,11 +50,56 @@ from .bonding_curve import BondingCurveCalculator, BondingCurveAccount
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached message templates per SDK instance
+MESSAGE_TEMPLATE_CACHE_SIZE = 256
+
+# Maximum number of accounts accepted by a single getMultipleAccounts call
+MAX_MULTIPLE_ACCOUNTS = 100
+
+
+def _decode_shortvec(data: bytes, offset: int) -> Tuple[int, int]:
+    """Decode a compact-u16 length prefix, returning (value, next_offset)."""
+    value = 0
+    for shift in (0, 7, 14):
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+    return value, offset
+
+
+def _message_shape(transaction: Transaction) -> Tuple[Any, ...]:
+    """
+    Program, accounts and data of every instruction in a transaction.
+
+    Everything a compiled message depends on besides the fee payer and the
+    recent blockhash, so a template is only reused for an identical message.
+    """
+    return tuple(
+        (
+            bytes(ix.program_id),
+            bytes(ix.data),
+            tuple((bytes(meta.pubkey), meta.is_signer, meta.is_writable) for meta in ix.keys),
+        )
+        for ix in transaction.instructions
+    )
+
+
+def _sign_message(keypair: Keypair, message: bytes) -> bytes:
+    """Sign raw message bytes and return the 64-byte signature."""
+    signed = keypair.sign(message)
+    return bytes(getattr(signed, "signature", signed))
+
 
 class PumpDotFunSDK:
     """
     Main SDK class for interacting with PumpFun protocol.
     """
+
+    # PumpFun program constants, decoded once per process
+    PUMP_FUN_PROGRAM_ID = PublicKey(_PUMP_FUN_PROGRAM_ID_STR)
+    PUMP_FUN_AUTHORITY = PublicKey("TSLvdd1pWpHVjahSpsvCXUbgwsL3JAcvokwaKt1eokM")
     
     def __init__(
         self,
@@ -57,6 +108,8 @@ class PumpDotFunSDK:
         commitment: str = DEFAULT_COMMITMENT,
         portal_api_url: str = "https://pumpportal.fun/api",
         portal_api_key: Optional[str] = None,
+        rpc_client: Optional[AsyncClient] = None,
+        share_websocket: bool = False,
     ):
         """
         Initialize PumpDotFun SDK.
@@ -67,23 +120,55 @@ class PumpDotFunSDK:
             commitment: Default commitment level
             portal_api_url: Base URL for PumpPortal API
             portal_api_key: Optional API key for PumpPortal
+            rpc_client: Existing RPC client to use, e.g. from
+                get_shared_rpc_client(); the SDK will not close it
+            share_websocket: Subscribe to events through the websocket hub
+                shared by SDK instances on the same endpoint instead of a
+                dedicated connection
         """
-        self.rpc_client = AsyncClient(rpc_endpoint, commitment=Commitment(commitment))
+        self.rpc_endpoint = rpc_endpoint
+        self._owns_rpc_client = rpc_client is None
+        self.rpc_client = rpc_client or AsyncClient(rpc_endpoint, commitment=Commitment(commitment))
         self.commitment = commitment
         self.portal_api_url = portal_api_url.rstrip("/")
         self.portal_api_key = portal_api_key
+
+        # Keep-alive HTTP client reused for every PumpPortal request
+        self._http = httpx.AsyncClient(timeout=30)
         
         # Initialize event manager if websocket endpoint provided
         if websocket_endpoint:
-            self.event_manager = EventManager(self.rpc_client, websocket_endpoint)
+            self.event_manager = EventManager(
+                self.rpc_client, websocket_endpoint, share_connection=share_websocket
+            )
         else:
             self.event_manager = None
-            
-        # PumpFun program constants (these would need to be actual values)
-        self.PUMP_FUN_PROGRAM_ID = PublicKey("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
-        self.PUMP_FUN_AUTHORITY = PublicKey("TSLvdd1pWpHVjahSpsvCXUbgwsL3JAcvokwaKt1eokM")
+
+        # Compiled message templates keyed by (signer, mint, direction):
+        # (message shape, message, blockhash offset, signer keys)
+        self._msg_template_cache: Dict[
+            Tuple[bytes, bytes, str], Tuple[Tuple[Any, ...], bytes, int, Tuple[bytes, ...]]
+        ] = {}
         
-        logger.info(f"Initialized PumpDotFun SDK with endpoint: {rpc_endpoint}")
+        logger.info("Initialized PumpDotFun SDK with endpoint: %s", rpc_endpoint)
+    
+    async def warmup(self) -> None:
+        """
+        Open the RPC and PumpPortal connections ahead of the first trade.
+
+        The first request on a fresh connection pays the TCP and TLS
+        handshakes; issuing a cheap health check and a HEAD request here
+        leaves ready sockets in both keep-alive pools. Failures are logged
+        and otherwise ignored.
+        """
+        results = await asyncio.gather(
+            self.rpc_client.is_connected(),
+            self._http.head(self.portal_api_url),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Warm-up request failed: %s", result)
     
     async def create_and_buy(
         self,
@@ -123,7 +208,7 @@ class PumpDotFunSDK:
             commitment = commitment or self.commitment
             buy_amount_lamports = sol_to_lamports(buy_amount_sol)
             
-            logger.info(f"Creating and buying token: {token_metadata.symbol}")
+            logger.info("Creating and buying token: %s", token_metadata.symbol)
             
             # Step 1: Create the token
             create_result = await self._create_token(
@@ -159,7 +244,7 @@ class PumpDotFunSDK:
             )
             
         except Exception as e:
-            logger.error(f"Error in create_and_buy: {e}")
+            logger.error("Error in create_and_buy: %s", e)
             return TransactionResult(
                 success=False,
                 error=str(e)
@@ -201,7 +286,7 @@ class PumpDotFunSDK:
             commitment = commitment or self.commitment
             buy_amount_lamports = sol_to_lamports(buy_amount_sol)
 
-            logger.info(f"Buying {buy_amount_sol} SOL worth of {mint}")
+            logger.info("Buying %s SOL worth of %s", buy_amount_sol, mint)
 
             if backend == BackendType.PUMP_PORTAL:
                 payload = {
@@ -259,14 +344,18 @@ class PumpDotFunSDK:
             min_tokens_out = calculate_slippage_amount(
                 expected_tokens, slippage_basis_points, is_minimum=True
             )
-            transaction = await self._build_buy_transaction(
+            transaction = self._build_buy_transaction(
                 buyer,
                 mint,
                 buy_amount_lamports,
                 min_tokens_out,
                 priority_fees,
             )
-            signature = await self._send_transaction(transaction, [buyer])
+            signature = await self._send_transaction(
+                transaction,
+                [buyer],
+                template_key=(bytes(buyer.public_key), bytes(mint), "buy"),
+            )
             confirmed = await wait_for_confirmation(
                 self.rpc_client, signature, commitment
             )
@@ -284,7 +373,7 @@ class PumpDotFunSDK:
             )
             
         except Exception as e:
-            logger.error(f"Error in buy: {e}")
+            logger.error("Error in buy: %s", e)
             return TransactionResult(
                 success=False,
                 error=str(e)
@@ -326,7 +415,7 @@ class PumpDotFunSDK:
             
             commitment = commitment or self.commitment
 
-            logger.info(f"Selling {sell_token_amount} tokens of {mint}")
+            logger.info("Selling %s tokens of %s", sell_token_amount, mint)
 
             if backend == BackendType.PUMP_PORTAL:
                 payload = {
@@ -386,14 +475,18 @@ class PumpDotFunSDK:
             min_sol_out = calculate_slippage_amount(
                 expected_sol, slippage_basis_points, is_minimum=True
             )
-            transaction = await self._build_sell_transaction(
+            transaction = self._build_sell_transaction(
                 seller,
                 mint,
                 sell_token_amount,
                 min_sol_out,
                 priority_fees,
             )
-            signature = await self._send_transaction(transaction, [seller])
+            signature = await self._send_transaction(
+                transaction,
+                [seller],
+                template_key=(bytes(seller.public_key), bytes(mint), "sell"),
+            )
             confirmed = await wait_for_confirmation(
                 self.rpc_client, signature, commitment
             )
@@ -411,12 +504,178 @@ class PumpDotFunSDK:
             )
             
         except Exception as e:
-            logger.error(f"Error in sell: {e}")
+            logger.error("Error in sell: %s", e)
             return TransactionResult(
                 success=False,
                 error=str(e)
             )
     
+    async def buy_many(
+        self,
+        orders: List[BuyOrder],
+        priority_fees: Optional[PriorityFee] = None,
+        commitment: str = None,
+    ) -> List[TransactionResult]:
+        """
+        Execute several buys with shared network round-trips.
+        
+        All orders share one blockhash fetch and one getMultipleAccounts
+        call for their bonding curves. The signed transactions are sent in
+        a single JSON-RPC batch and confirmed with batched status polls.
+        
+        Args:
+            orders: Buy orders to execute
+            priority_fees: Priority fee configuration
+            commitment: Transaction commitment level
+            
+        Returns:
+            Transaction result for each order, in input order
+        """
+        if not orders:
+            return []
+
+        commitment = commitment or self.commitment
+        results: List[Optional[TransactionResult]] = [None] * len(orders)
+
+        try:
+            bonding_curves = await self._get_bonding_curve_accounts(
+                [order.mint for order in orders]
+            )
+            recent_blockhash = await self.rpc_client.get_latest_blockhash()
+            blockhash = recent_blockhash.value.blockhash
+        except Exception as e:
+            logger.error("Error in buy_many: %s", e)
+            return [TransactionResult(success=False, error=str(e)) for _ in orders]
+
+        pending = []
+        for index, order in enumerate(orders):
+            try:
+                if not validate_slippage(order.slippage_basis_points):
+                    raise ValidationError("Invalid slippage value")
+
+                if order.buy_amount_sol <= 0:
+                    raise ValidationError("Buy amount must be positive")
+
+                bonding_curve_account = bonding_curves.get(bytes(order.mint))
+                if bonding_curve_account is None:
+                    raise NetworkError("Bonding curve account not found")
+
+                buy_amount_lamports = sol_to_lamports(order.buy_amount_sol)
+                expected_tokens = BondingCurveCalculator.get_buy_price(
+                    buy_amount_lamports,
+                    bonding_curve_account.real_sol_reserves,
+                    bonding_curve_account.real_token_reserves,
+                )
+                min_tokens_out = calculate_slippage_amount(
+                    expected_tokens, order.slippage_basis_points, is_minimum=True
+                )
+                transaction = self._build_buy_transaction(
+                    order.buyer,
+                    order.mint,
+                    buy_amount_lamports,
+                    min_tokens_out,
+                    priority_fees,
+                )
+                wire = self._sign_from_template(
+                    (bytes(order.buyer.public_key), bytes(order.mint), "buy"),
+                    transaction,
+                    [order.buyer],
+                    blockhash,
+                )
+                pending.append((index, wire, {
+                    "mint": str(order.mint),
+                    "buy_amount_sol": order.buy_amount_sol,
+                    "expected_tokens": expected_tokens,
+                    "min_tokens_out": min_tokens_out,
+                }))
+            except Exception as e:
+                results[index] = TransactionResult(success=False, error=str(e))
+
+        await self._send_and_confirm_many(pending, results, commitment)
+        return results
+
+    async def sell_many(
+        self,
+        orders: List[SellOrder],
+        priority_fees: Optional[PriorityFee] = None,
+        commitment: str = None,
+    ) -> List[TransactionResult]:
+        """
+        Execute several sells with shared network round-trips.
+        
+        Works like buy_many: one blockhash fetch, one bonding-curve fetch,
+        one batched send and batched confirmation.
+        
+        Args:
+            orders: Sell orders to execute
+            priority_fees: Priority fee configuration
+            commitment: Transaction commitment level
+            
+        Returns:
+            Transaction result for each order, in input order
+        """
+        if not orders:
+            return []
+
+        commitment = commitment or self.commitment
+        results: List[Optional[TransactionResult]] = [None] * len(orders)
+
+        try:
+            bonding_curves = await self._get_bonding_curve_accounts(
+                [order.mint for order in orders]
+            )
+            recent_blockhash = await self.rpc_client.get_latest_blockhash()
+            blockhash = recent_blockhash.value.blockhash
+        except Exception as e:
+            logger.error("Error in sell_many: %s", e)
+            return [TransactionResult(success=False, error=str(e)) for _ in orders]
+
+        pending = []
+        for index, order in enumerate(orders):
+            try:
+                if not validate_slippage(order.slippage_basis_points):
+                    raise ValidationError("Invalid slippage value")
+
+                if order.sell_token_amount <= 0:
+                    raise ValidationError("Sell amount must be positive")
+
+                bonding_curve_account = bonding_curves.get(bytes(order.mint))
+                if bonding_curve_account is None:
+                    raise NetworkError("Bonding curve account not found")
+
+                expected_sol = BondingCurveCalculator.get_sell_price(
+                    order.sell_token_amount,
+                    bonding_curve_account.real_sol_reserves,
+                    bonding_curve_account.real_token_reserves,
+                )
+                min_sol_out = calculate_slippage_amount(
+                    expected_sol, order.slippage_basis_points, is_minimum=True
+                )
+                transaction = self._build_sell_transaction(
+                    order.seller,
+                    order.mint,
+                    order.sell_token_amount,
+                    min_sol_out,
+                    priority_fees,
+                )
+                wire = self._sign_from_template(
+                    (bytes(order.seller.public_key), bytes(order.mint), "sell"),
+                    transaction,
+                    [order.seller],
+                    blockhash,
+                )
+                pending.append((index, wire, {
+                    "mint": str(order.mint),
+                    "sell_token_amount": order.sell_token_amount,
+                    "expected_sol": expected_sol,
+                    "min_sol_out": min_sol_out,
+                }))
+            except Exception as e:
+                results[index] = TransactionResult(success=False, error=str(e))
+
+        await self._send_and_confirm_many(pending, results, commitment)
+        return results
+    
     def add_event_listener(
         self,
         event_type: PumpFunEventType,
@@ -456,10 +715,10 @@ class PumpDotFunSDK:
             
         await self.event_manager.start_listening()
     
-    def stop_event_listening(self) -> None:
+    async def stop_event_listening(self) -> None:
         """Stop listening for events."""
         if self.event_manager:
-            self.event_manager.stop_listening()
+            await self.event_manager.stop_listening()
     
     # Private helper methods
     
@@ -538,7 +797,7 @@ class PumpDotFunSDK:
         except Exception as e:
             return TransactionResult(success=False, error=str(e))
     
-    async def _build_buy_transaction(
+    def _build_buy_transaction(
         self,
         buyer: Keypair,
         mint: PublicKey,
@@ -560,7 +819,7 @@ class PumpDotFunSDK:
         transaction.add(instruction)
         return transaction
     
-    async def _build_sell_transaction(
+    def _build_sell_transaction(
         self,
         seller: Keypair,
         mint: PublicKey,
@@ -585,16 +844,28 @@ class PumpDotFunSDK:
     async def _send_transaction(
         self,
         transaction: Transaction,
-        signers: list[Keypair]
+        signers: list[Keypair],
+        template_key: Optional[Tuple[bytes, bytes, str]] = None,
     ) -> str:
-        """Send transaction to Solana."""
+        """
+        Send transaction to Solana.
+
+        When ``template_key`` is given, the compiled message is cached under
+        that key and subsequent sends only patch the recent blockhash into a
+        copy of the cached bytes before signing.
+        """
         try:
             # Get recent blockhash
             recent_blockhash = await self.rpc_client.get_latest_blockhash()
-            transaction.recent_blockhash = str(recent_blockhash.value.blockhash)
-            
+            blockhash = recent_blockhash.value.blockhash
+
             # Send transaction
-            response = await self.rpc_client.send_transaction(transaction, *signers)
+            if template_key is not None:
+                wire = self._sign_from_template(template_key, transaction, signers, blockhash)
+                response = await self.rpc_client.send_raw_transaction(wire)
+            else:
+                transaction.recent_blockhash = str(blockhash)
+                response = await self.rpc_client.send_transaction(transaction, *signers)
             
             if hasattr(response, 'value'):
                 return response.value
@@ -604,16 +875,138 @@ class PumpDotFunSDK:
         except Exception as e:
             raise TransactionError(f"Transaction failed: {e}")
 
+    def _sign_from_template(
+        self,
+        template_key: Tuple[bytes, bytes, str],
+        transaction: Transaction,
+        signers: list[Keypair],
+        blockhash: Any,
+    ) -> bytes:
+        """
+        Build a signed wire transaction from a cached message template.
+
+        The template is recompiled when the transaction's instructions
+        (amounts, slippage, priority fees, accounts) differ from the cached
+        ones, so only the blockhash is ever patched in place.
+        """
+        shape = _message_shape(transaction)
+        template = self._msg_template_cache.get(template_key)
+        if template is None or template[0] != shape:
+            template = (shape,) + self._compile_message_template(transaction, signers, blockhash)
+            if template_key not in self._msg_template_cache and \
+                    len(self._msg_template_cache) >= MESSAGE_TEMPLATE_CACHE_SIZE:
+                self._msg_template_cache.pop(next(iter(self._msg_template_cache)))
+            self._msg_template_cache[template_key] = template
+
+        _, message_template, blockhash_offset, signer_keys = template
+        message = bytearray(message_template)
+        message[blockhash_offset:blockhash_offset + 32] = bytes(blockhash)
+        message = bytes(message)
+
+        keypairs = {bytes(keypair.public_key): keypair for keypair in signers}
+        signatures = b"".join(_sign_message(keypairs[key], message) for key in signer_keys)
+
+        # Signature count fits in a single shortvec byte (< 128 signers)
+        return bytes([len(signer_keys)]) + signatures + message
+
+    @staticmethod
+    def _compile_message_template(
+        transaction: Transaction,
+        signers: list[Keypair],
+        blockhash: Any,
+    ) -> Tuple[bytes, int, Tuple[bytes, ...]]:
+        """
+        Compile a transaction message and locate its patchable fields.
+
+        Returns:
+            Serialized message, offset of the recent blockhash and the
+            public keys of the required signers in signature order
+        """
+        if transaction.fee_payer is None:
+            transaction.fee_payer = signers[0].public_key
+        transaction.recent_blockhash = str(blockhash)
+        message = transaction.serialize_message()
+
+        # Legacy message layout: 3-byte header, account keys, recent blockhash
+        num_signers = message[0]
+        num_keys, offset = _decode_shortvec(message, 3)
+        signer_keys = tuple(
+            message[offset + 32 * i:offset + 32 * (i + 1)] for i in range(num_signers)
+        )
+        return message, offset + 32 * num_keys, signer_keys
+
+    async def _send_and_confirm_many(
+        self,
+        pending: List[Tuple[int, bytes, Dict[str, Any]]],
+        results: List[Optional[TransactionResult]],
+        commitment: str,
+    ) -> None:
+        """Send signed transactions as one batch and fill in their results."""
+        if not pending:
+            return
+
+        try:
+            responses = await self._rpc_batch([
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "sendTransaction",
+                    "params": [
+                        base64.b64encode(wire).decode("ascii"),
+                        {"encoding": "base64", "preflightCommitment": commitment},
+                    ],
+                }
+                for request_id, (_, wire, _) in enumerate(pending)
+            ])
+        except Exception as e:
+            for index, _, _ in pending:
+                results[index] = TransactionResult(
+                    success=False, error=f"Transaction failed: {e}"
+                )
+            return
+
+        sent = []
+        for (index, _, details), response in zip(pending, responses):
+            if "result" in response:
+                sent.append((index, response["result"], details))
+            else:
+                error = response.get("error", {}).get("message", "Failed to send transaction")
+                results[index] = TransactionResult(
+                    success=False, error=f"Transaction failed: {error}"
+                )
+
+        if not sent:
+            return
+
+        confirmed = await wait_for_confirmations(
+            self.rpc_client,
+            [Signature.from_string(signature) for _, signature, _ in sent],
+            commitment,
+        )
+        for (index, signature, details), ok in zip(sent, confirmed):
+            results[index] = TransactionResult(
+                success=ok,
+                signature=signature,
+                error=None if ok else "Transaction not confirmed within timeout",
+                results=details,
+            )
+
+    async def _rpc_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST a JSON-RPC batch to the RPC endpoint, returning responses in request order."""
+        response = await self._http.post(self.rpc_endpoint, json=requests)
+        response.raise_for_status()
+        by_id = {item.get("id"): item for item in response.json()}
+        return [by_id.get(request["id"], {}) for request in requests]
+
     async def _portal_request(self, method: str, endpoint: str, json: Dict[str, Any]) -> Dict[str, Any]:
         """Send a request to the PumpPortal API."""
         url = f"{self.portal_api_url}/{endpoint.lstrip('/') }"
         headers = {}
         if self.portal_api_key:
             headers["X-API-KEY"] = self.portal_api_key
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.request(method, url, json=json, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.request(method, url, json=json, headers=headers)
+        response.raise_for_status()
+        return response.json()
     
     async def _get_bonding_curve_account(self, mint: PublicKey) -> BondingCurveAccount:
         """Get bonding curve account for a mint."""
@@ -635,6 +1028,36 @@ class PumpDotFunSDK:
         except Exception as e:
             raise NetworkError(f"Failed to get bonding curve account: {e}")
     
+    async def _get_bonding_curve_accounts(
+        self,
+        mints: List[PublicKey]
+    ) -> Dict[bytes, BondingCurveAccount]:
+        """
+        Get bonding curve accounts for several mints with getMultipleAccounts.
+        
+        Returns:
+            Bonding curve accounts keyed by mint bytes; mints without an
+            account are omitted
+        """
+        unique_mints = list({bytes(mint): mint for mint in mints}.values())
+        accounts = {}
+
+        try:
+            for start in range(0, len(unique_mints), MAX_MULTIPLE_ACCOUNTS):
+                chunk = unique_mints[start:start + MAX_MULTIPLE_ACCOUNTS]
+                response = await self.rpc_client.get_multiple_accounts(
+                    [self._derive_bonding_curve_address(mint) for mint in chunk]
+                )
+                for mint, account in zip(chunk, response.value):
+                    if account:
+                        accounts[bytes(mint)] = BondingCurveAccount(
+                            self._parse_bonding_curve_data(account.data)
+                        )
+        except Exception as e:
+            raise NetworkError(f"Failed to get bonding curve accounts: {e}")
+
+        return accounts
+    
     def _derive_bonding_curve_address(self, mint: PublicKey) -> PublicKey:
         """Derive bonding curve account address."""
         # This would implement the actual derivation logic
@@ -659,8 +1082,10 @@ class PumpDotFunSDK:
     async def close(self) -> None:
         """Close the SDK and cleanup resources."""
         if self.event_manager:
-            self.event_manager.stop_listening()
+            await self.event_manager.stop_listening()
             
-        await self.rpc_client.close()
+        if self._owns_rpc_client:
+            await self.rpc_client.close()
+        await self._http.aclose()
         logger.info("PumpDotFun SDK closed")
 
@@ -3,44 +3,253 @@ Event handling for PumpDotFun SDK.
 """
 
 import asyncio
-import logging
+import base64
+import binascii
+import collections
 import inspect
+import logging
+import random
+import re
 import time
-from typing import Dict, Callable, Any, Optional, List
+from typing import (
+    Dict, Callable, Any, Optional, List, Tuple, Union, Iterable, FrozenSet, Deque, Awaitable
+)
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.websocket_api import connect
 from solana.publickey import PublicKey
-from .types import PumpFunEventType, CreateEvent, TradeEvent, CompleteEvent, EventCallback
+from websockets.exceptions import ConnectionClosed
+from .types import (
+    PumpFunEventType, CreateEvent, TradeEvent, CompleteEvent, EventCallback, BatchEventCallback,
+    PUMP_FUN_PROGRAM_ID
+)
 from .utils import PumpFunError
+from .websocket_hub import WebSocketHub
+from ._event_parser import parse_event, _pk as _cached_pk
 
 logger = logging.getLogger(__name__)
 
+# Event type values, bound once instead of an enum lookup per event
+_CREATE = PumpFunEventType.CREATE_EVENT.value
+_TRADE = PumpFunEventType.TRADE_EVENT.value
+_COMPLETE = PumpFunEventType.COMPLETE_EVENT.value
+
+# logsSubscribe filter for PumpFun program logs
+_LOGS_FILTER = {"mentions": [PUMP_FUN_PROGRAM_ID]}
+
+# Anchor events are emitted as base64 after this prefix
+_PROGRAM_DATA_PREFIX = "Program data: "
+
+_PROGRAM_LOG_PREFIX = "Program log: "
+
+# Event kind by the first two characters of a log body that leads with the
+# tag, and by the three characters ending the kind when the tag is embedded
+_EVENT_KIND_BY_PREFIX = {"Cr": "Create", "Tr": "Trade", "Co": "Complete"}
+_EVENT_KIND_BY_SUFFIX = {"ate": "Create", "ade": "Trade", "ete": "Complete"}
+
+# Fallback for lines where "Program log: " is not at the start;
+# group 1 is the log body, group 2 the event kind
+_EVENT_LOG_PATTERN = re.compile(
+    r"Program log: (.*?(Create|Trade|Complete)Event.*)", re.DOTALL
+)
+
+# key=value pairs of a text event log, e.g.
+# "CreateEvent: mint=..., name=..., symbol=..."; values end at a comma or
+# whitespace so "sol_amount=12 lamports" yields "12"
+_EVENT_FIELD_PATTERN = re.compile(r"(\w+)=([^,\s]+)")
+
+# Text event fields by event type: (field, log key, conversion, default
+# when the log omits the key)
+_TEXT_EVENT_FIELDS = {
+    _CREATE: (
+        ("mint", "mint", str, "placeholder"),
+        ("name", "name", str, "placeholder"),
+        ("symbol", "symbol", str, "placeholder"),
+        ("uri", "uri", str, "placeholder"),
+        ("user", "user", str, "placeholder"),
+    ),
+    _TRADE: (
+        ("mint", "mint", str, "placeholder"),
+        ("user", "user", str, "placeholder"),
+        ("is_buy", "buy", lambda value: value != "false", True),
+        ("sol_amount", "sol_amount", int, 0),
+        ("token_amount", "token_amount", int, 0),
+    ),
+    _COMPLETE: (
+        ("mint", "mint", str, "placeholder"),
+        ("user", "user", str, "placeholder"),
+    ),
+}
+
+# Event class -> event type value used to bucket listeners
+_EVENT_TYPE_BY_CLASS = {
+    CreateEvent: _CREATE,
+    TradeEvent: _TRADE,
+    CompleteEvent: _COMPLETE,
+}
+
+# Event kind -> name of the EventManager parser for that event
+_EVENT_PARSERS = {
+    "Create": "_parse_create_event",
+    "Trade": "_parse_trade_event",
+    "Complete": "_parse_complete_event",
+}
+
+# Direct log accessors keyed by (message is dict, result is dict)
+_LOG_ACCESSORS = {
+    (True, True): lambda message: message['result']['logs'],
+    (True, False): lambda message: message['result'].logs,
+    (False, True): lambda message: message.result['logs'],
+    (False, False): lambda message: message.result.logs,
+}
+
+
+def _match_event_kind(body: str) -> Optional[str]:
+    """Find the first event tag in a log body and return its kind."""
+    kind = _EVENT_KIND_BY_PREFIX.get(body[:2])
+    if kind and body.startswith(kind) and body.startswith("Event", len(kind)):
+        return kind
+    
+    index = body.find("Event", 5)
+    while index != -1:
+        kind = _EVENT_KIND_BY_SUFFIX.get(body[index - 3:index])
+        if kind and body.startswith(kind, index - len(kind)):
+            return kind
+        index = body.find("Event", index + 5)
+    return None
+
+
+def _log_callback_error(listener_id: int, error: Exception) -> None:
+    """Log a failing listener; the traceback is only captured at DEBUG level."""
+    logger.error(
+        "Error in event callback %d: %r", listener_id, error,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+
+
+def _pk(address: Union[str, bytes, bytearray]) -> PublicKey:
+    """
+    Build a PublicKey through the event parser's shared cache.
+    
+    Raw 32-byte keys are taken as-is, skipping the base58 decode of strings;
+    bytearrays are copied to bytes first since the cache needs hashable keys.
+    """
+    if isinstance(address, bytearray):
+        address = bytes(address)
+    return _cached_pk(address)
+
+
+def _make_create_event(event_data: Dict[str, Any]) -> CreateEvent:
+    """Build a CreateEvent from parsed event data."""
+    return CreateEvent(
+        mint=_pk(event_data["mint"]),
+        name=event_data["name"],
+        symbol=event_data["symbol"],
+        uri=event_data["uri"],
+        user=_pk(event_data["user"]),
+        timestamp=event_data["timestamp"]
+    )
+
+
+def _make_trade_event(event_data: Dict[str, Any]) -> TradeEvent:
+    """Build a TradeEvent from parsed event data."""
+    return TradeEvent(
+        mint=_pk(event_data["mint"]),
+        user=_pk(event_data["user"]),
+        is_buy=event_data["is_buy"],
+        sol_amount=event_data["sol_amount"],
+        token_amount=event_data["token_amount"],
+        timestamp=event_data["timestamp"]
+    )
+
+
+def _make_complete_event(event_data: Dict[str, Any]) -> CompleteEvent:
+    """Build a CompleteEvent from parsed event data."""
+    return CompleteEvent(
+        mint=_pk(event_data["mint"]),
+        user=_pk(event_data["user"]),
+        timestamp=event_data["timestamp"]
+    )
+
+
+# Event type value -> event object constructor
+_EVENT_CTORS = {
+    _CREATE: _make_create_event,
+    _TRADE: _make_trade_event,
+    _COMPLETE: _make_complete_event,
+}
+
 
 class EventManager:
     """
     Manages events from the Solana blockchain for PumpFun protocol.
     """
     
-    def __init__(self, rpc_client: AsyncClient, websocket_url: str):
+    def __init__(
+        self,
+        rpc_client: AsyncClient,
+        websocket_url: str,
+        hub: Optional[WebSocketHub] = None,
+        share_connection: bool = False
+    ):
         """
         Initialize event manager.
         
         Args:
             rpc_client: Solana RPC client
             websocket_url: WebSocket URL for real-time events
+            hub: Optional shared websocket hub to subscribe through instead
+                of opening a dedicated connection
+            share_connection: Without a hub, subscribe through the hub
+                shared by every manager on the same websocket URL
         """
         self.rpc_client = rpc_client
         self.websocket_url = websocket_url
-        self.listeners: Dict[int, Dict[str, Any]] = {}
+        self.hub = hub
+        self.share_connection = share_connection
+        # Hub holding hub_subscription_id, resolved when listening starts
+        self._subscribed_hub: Optional[WebSocketHub] = None
+        self.hub_subscription_id: Optional[int] = None
+        # Dispatch table: event type value ->
+        # [(listener_id, callback, batch, mints)]
+        self._by_type: Dict[str, List[Tuple[int, Callable, bool, Optional[FrozenSet[str]]]]] = {}
+        self._id_to_type: Dict[int, str] = {}
+        # Parsed (event_type, event, slot, signature) awaiting flush()
+        self._pending: List[Tuple[str, Any, int, str]] = []
         self.next_id = 1
+        # Log accessor specialized to the message shape, set on first parse
+        self._get_logs: Optional[Callable[[Any], List[str]]] = None
         self.is_listening = False
         self.websocket_connection = None
         self.listen_task = None
+        # Frames received but not yet processed, and the future that wakes
+        # the listen loop when the inbox goes from empty to non-empty
+        self._inbox: Deque[Any] = collections.deque()
+        self._wake: Optional[asyncio.Future] = None
         
+    @property
+    def listeners(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Registered listeners by ID, built on access from the dispatch table.
+        
+        Returns:
+            Listener ID -> {"event_type", "callback", "batch"}
+        """
+        return {
+            listener_id: {
+                "event_type": PumpFunEventType(event_type),
+                "callback": callback,
+                "batch": batch
+            }
+            for event_type, bucket in self._by_type.items()
+            for listener_id, callback, batch, _ in bucket
+        }
+    
     def add_listener(
         self,
         event_type: PumpFunEventType,
-        callback: EventCallback
+        callback: Union[EventCallback, BatchEventCallback],
+        batch: bool = False,
+        mint_filter: Optional[Iterable[str]] = None
     ) -> int:
         """
         Add an event listener.
@@ -48,6 +257,9 @@ class EventManager:
         Args:
             event_type: Type of event to listen for
             callback: Callback function to execute when event occurs
+            batch: If True, callback receives a list of (event, slot, signature)
+                tuples once per flush instead of one call per event
+            mint_filter: Only deliver events for these mint addresses
             
         Returns:
             Listener ID
@@ -55,12 +267,14 @@ class EventManager:
         listener_id = self.next_id
         self.next_id += 1
         
-        self.listeners[listener_id] = {
-            "event_type": event_type,
-            "callback": callback
-        }
+        mints = frozenset(mint_filter) if mint_filter is not None else None
         
-        logger.info(f"Added event listener {listener_id} for {event_type.value}")
+        self._by_type.setdefault(event_type.value, []).append(
+            (listener_id, callback, batch, mints)
+        )
+        self._id_to_type[listener_id] = event_type.value
+        
+        logger.info("Added event listener %d for %s", listener_id, event_type.value)
         return listener_id
     
     def remove_listener(self, listener_id: int) -> None:
@@ -70,11 +284,12 @@ class EventManager:
         Args:
             listener_id: ID of the listener to remove
         """
-        if listener_id in self.listeners:
-            del self.listeners[listener_id]
-            logger.info(f"Removed event listener {listener_id}")
+        if listener_id in self._id_to_type:
+            bucket = self._by_type[self._id_to_type.pop(listener_id)]
+            bucket[:] = [entry for entry in bucket if entry[0] != listener_id]
+            logger.info("Removed event listener %d", listener_id)
         else:
-            logger.warning(f"Listener {listener_id} not found")
+            logger.warning("Listener %d not found", listener_id)
     
     async def start_listening(self) -> None:
         """
@@ -85,87 +300,234 @@ class EventManager:
             return
             
         self.is_listening = True
-        self.listen_task = asyncio.create_task(self._listen_loop())
+        hub = self.hub
+        if hub is None and self.share_connection:
+            hub = WebSocketHub.shared(self.websocket_url)
+        if hub:
+            self._subscribed_hub = hub
+            self.hub_subscription_id = await hub.subscribe_logs(
+                _LOGS_FILTER["mentions"], self._on_logs_notification
+            )
+        else:
+            self.listen_task = asyncio.create_task(self._listen_loop())
         logger.info("Started listening for PumpFun events")
     
-    def stop_listening(self) -> None:
+    async def stop_listening(self) -> None:
         """
         Stop listening for events.
+        
+        Waits for the listen task to finish and the connection to close.
         """
         self.is_listening = False
         
-        if self.listen_task:
-            self.listen_task.cancel()
+        task, self.listen_task = self.listen_task, None
+        if task:
+            task.cancel()
+            # A listener may stop from inside the listen task itself
+            if task is not asyncio.current_task():
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        hub, self._subscribed_hub = self._subscribed_hub, None
+        if hub and self.hub_subscription_id is not None:
+            subscription_id, self.hub_subscription_id = self.hub_subscription_id, None
+            await hub.unsubscribe(subscription_id)
 
         if self.websocket_connection:
-            close_method = self.websocket_connection.close
-            if inspect.iscoroutinefunction(close_method):
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(close_method())
-                except RuntimeError:
-                    asyncio.run(close_method())
-            else:
-                close_method()
+            await self.websocket_connection.close()
+            self.websocket_connection = None
             
         logger.info("Stopped listening for events")
     
     async def _listen_loop(self) -> None:
         """
         Main event listening loop.
+        
+        A receiver task moves frames into an inbox and this loop drains
+        everything that has arrived in one pass, flushing listeners once per
+        drain so a burst reaches them as one batch. Reconnects in place with
+        exponential backoff (1s doubling up to 60s, plus up to 0.5s of
+        jitter) until stop_listening() is called.
         """
-        try:
-            async with connect(self.websocket_url) as websocket:
-                self.websocket_connection = websocket
-                
-                # Subscribe to program logs for PumpFun program
-                await websocket.logs_subscribe(
-                    filter_={"mentions": [self._get_pump_fun_program_id()]}
-                )
-                
-                async for message in websocket:
-                    if not self.is_listening:
-                        break
-                        
-                    await self._process_message(message)
+        backoff = 1.0
+        loop = asyncio.get_running_loop()
+        
+        while self.is_listening:
+            try:
+                async with connect(self.websocket_url) as websocket:
+                    self.websocket_connection = websocket
                     
-        except Exception as e:
-            logger.error(f"Error in event listening loop: {e}")
+                    # Subscribe to program logs for PumpFun program
+                    await websocket.logs_subscribe(filter_=_LOGS_FILTER)
+                    
+                    self._wake = loop.create_future()
+                    receiver = asyncio.create_task(self._receive(websocket))
+                    try:
+                        while self.is_listening:
+                            await self._wake
+                            self._wake = loop.create_future()
+                            
+                            if self._inbox:
+                                # Only a connection that delivers resets the backoff
+                                backoff = 1.0
+                            while self._inbox and self.is_listening:
+                                message = self._inbox.popleft()
+                                for item in (message if isinstance(message, list) else [message]):
+                                    await self._process_message(item, flush=False)
+                            await self._await_callbacks(self.flush())
+                            
+                            if receiver.done():
+                                # Re-raises a connection error for the backoff below
+                                receiver.result()
+                                break
+                    finally:
+                        receiver.cancel()
+                        
+            except (ConnectionClosed, OSError, asyncio.TimeoutError) as e:
+                # Routine disconnects: no traceback, just reconnect
+                logger.warning("Event websocket disconnected: %s", e)
+            except Exception as e:
+                logger.error("Error in event listening loop: %s", e)
+            finally:
+                self.websocket_connection = None
+            
+            # Clean server closes back off too, so an endpoint that accepts
+            # and immediately closes does not cause a tight reconnect loop
             if self.is_listening:
-                # Attempt to reconnect after a delay
-                await asyncio.sleep(5)
-                if self.is_listening:
-                    await self.start_listening()
+                # Jitter keeps many clients from reconnecting in lockstep
+                await asyncio.sleep(backoff + random.uniform(0, 0.5))
+                backoff = min(backoff * 2, 60.0)
     
-    async def _process_message(self, message: Any) -> None:
+    async def _receive(self, websocket: Any) -> None:
+        """
+        Append frames from the connection to the inbox and wake the listen loop.
+        
+        Args:
+            websocket: Open websocket connection
+        """
+        try:
+            async for message in websocket:
+                self._inbox.append(message)
+                if not self._wake.done():
+                    self._wake.set_result(None)
+        finally:
+            # Also wake the loop when the connection ends
+            if not self._wake.done():
+                self._wake.set_result(None)
+    
+    async def _on_logs_notification(self, params: Dict[str, Any]) -> None:
+        """
+        Handle a logsSubscribe notification delivered by the websocket hub.
+        
+        Args:
+            params: Notification params from the hub
+        """
+        if not self.is_listening:
+            return
+        await self._process_message({"result": params.get("result", {}).get("value")})
+    
+    async def _process_message(self, message: Any, flush: bool = True) -> None:
         """
         Process incoming WebSocket message.
         
         Args:
             message: WebSocket message
+            flush: Deliver the event to listeners immediately; with False it
+                is queued until the next flush()
         """
         try:
             # Parse the message and extract event information
             event_data = self._parse_log_message(message)
             
-            if event_data:
+            if isinstance(event_data, dict):
+                # Text log path: build the event object from its fields
                 event_type = event_data.get("event_type")
-                slot = event_data.get("slot", 0)
-                signature = event_data.get("signature", "")
                 
-                # Notify relevant listeners
-                for listener_id, listener in self.listeners.items():
-                    if listener["event_type"].value == event_type:
-                        try:
-                            event_obj = self._create_event_object(event_type, event_data)
-                            listener["callback"](event_obj, slot, signature)
-                        except Exception as e:
-                            logger.error(f"Error in event callback {listener_id}: {e}")
+                if self._by_type.get(event_type):
+                    self._pending.append((
+                        event_type,
+                        self._create_event_object(event_type, event_data),
+                        event_data.get("slot", 0),
+                        event_data.get("signature", "")
+                    ))
+            elif event_data is not None:
+                # Program data path: the parser already built the event
+                event_type = _EVENT_TYPE_BY_CLASS[type(event_data)]
+                
+                if self._by_type.get(event_type):
+                    self._pending.append((event_type, event_data, 0, ""))
                             
         except Exception as e:
-            logger.error(f"Error processing event message: {e}")
+            logger.error("Error processing event message: %s", e)
+        
+        if flush:
+            await self._await_callbacks(self.flush())
     
-    def _parse_log_message(self, message: Any) -> Optional[Dict[str, Any]]:
+    def flush(self) -> List[Tuple[int, Awaitable]]:
+        """
+        Deliver queued events to listeners.
+        
+        Scalar listeners are called once per event; batch listeners are
+        called once with every queued event of their type. Callbacks are
+        called directly; coroutine callbacks are not awaited here.
+        
+        Returns:
+            (listener ID, awaitable) for each coroutine callback result
+        """
+        awaiting: List[Tuple[int, Awaitable]] = []
+        if not self._pending:
+            return awaiting
+        
+        pending, self._pending = self._pending, []
+        batches: Dict[int, Tuple[Callable, List[Tuple[Any, int, str]]]] = {}
+        
+        for event_type, event_obj, slot, signature in pending:
+            mint = None
+            
+            for listener_id, callback, batch, mints in self._by_type.get(event_type, ()):
+                if mints is not None:
+                    if mint is None:
+                        # Encoded once per event, and only for filtered listeners
+                        mint = str(event_obj.mint)
+                    if mint not in mints:
+                        continue
+                
+                if batch:
+                    batches.setdefault(listener_id, (callback, []))[1].append(
+                        (event_obj, slot, signature)
+                    )
+                    continue
+                try:
+                    result = callback(event_obj, slot, signature)
+                except Exception as e:
+                    _log_callback_error(listener_id, e)
+                    continue
+                if result is not None and inspect.isawaitable(result):
+                    awaiting.append((listener_id, result))
+        
+        for listener_id, (callback, events) in batches.items():
+            try:
+                result = callback(events)
+            except Exception as e:
+                _log_callback_error(listener_id, e)
+                continue
+            if result is not None and inspect.isawaitable(result):
+                awaiting.append((listener_id, result))
+        
+        return awaiting
+    
+    @staticmethod
+    async def _await_callbacks(awaiting: List[Tuple[int, Awaitable]]) -> None:
+        """Await coroutine callback results returned by flush()."""
+        for listener_id, result in awaiting:
+            try:
+                await result
+            except Exception as e:
+                _log_callback_error(listener_id, e)
+    
+    def _parse_log_message(self, message: Any) -> Optional[Any]:
         """
         Parse log message to extract event data.
         
@@ -173,73 +535,124 @@ class EventManager:
             message: Raw log message
             
         Returns:
-            Parsed event data or None
+            Event object for Anchor "Program data:" events, event data
+            dictionary for text log events, or None
         """
         # This would need to be implemented based on the actual
         # log format from PumpFun program
         try:
-            result = None
-            if isinstance(message, dict):
-                result = message.get('result')
-            else:
-                result = getattr(message, 'result', None)
-
-            if result:
-                logs = (
-                    result.get('logs', [])
-                    if isinstance(result, dict)
-                    else getattr(result, 'logs', [])
-                )
-
-                for log in logs:
-                    if 'Program log:' in log:
-                        log_data = log.split('Program log: ', 1)[1]
-
-                        if 'CreateEvent' in log_data:
-                            return self._parse_create_event(log_data)
-                        elif 'TradeEvent' in log_data:
-                            return self._parse_trade_event(log_data)
-                        elif 'CompleteEvent' in log_data:
-                            return self._parse_complete_event(log_data)
-                            
+            logs = None
+            if self._get_logs is not None:
+                try:
+                    logs = self._get_logs(message)
+                except (KeyError, AttributeError, TypeError):
+                    pass
+            
+            if logs is None:
+                logs = self._extract_logs(message)
+
+            for log in logs:
+                if log.startswith(_PROGRAM_DATA_PREFIX):
+                    try:
+                        event_data = parse_event(
+                            base64.b64decode(log[len(_PROGRAM_DATA_PREFIX):])
+                        )
+                    except binascii.Error:
+                        event_data = None
+                    if event_data:
+                        return event_data
+                    continue
+                
+                # Invoke/consumed/success lines make up most logs; one
+                # substring scan skips them before any slicing or regex
+                if "Event" not in log:
+                    continue
+                
+                if log.startswith(_PROGRAM_LOG_PREFIX):
+                    body = log[len(_PROGRAM_LOG_PREFIX):]
+                    kind = _match_event_kind(body)
+                    if kind:
+                        return getattr(self, _EVENT_PARSERS[kind])(body)
+                    continue
+                
+                match = _EVENT_LOG_PATTERN.search(log)
+                if match:
+                    parser = getattr(self, _EVENT_PARSERS[match.group(2)])
+                    return parser(match.group(1))
+
         except Exception as e:
-            logger.error(f"Error parsing log message: {e}")
+            logger.error("Error parsing log message: %s", e)
             
         return None
     
+    def _extract_logs(self, message: Any) -> List[str]:
+        """
+        General log extraction for dict- or attribute-shaped messages.
+        
+        Also specializes _get_logs to the shape seen, so later messages
+        from the same connection take a single direct access.
+        
+        Args:
+            message: Raw log message
+            
+        Returns:
+            Log lines, empty if the message carries none
+        """
+        message_is_dict = isinstance(message, dict)
+        if message_is_dict:
+            result = message.get('result')
+        else:
+            result = getattr(message, 'result', None)
+        
+        if not result:
+            return []
+        
+        result_is_dict = isinstance(result, dict)
+        if self._get_logs is None:
+            self._get_logs = _LOG_ACCESSORS[(message_is_dict, result_is_dict)]
+        
+        if result_is_dict:
+            return result.get('logs', [])
+        return getattr(result, 'logs', [])
+    
+    def _parse_kv_event(self, log_data: str, event_type: str) -> Dict[str, Any]:
+        """
+        Parse a text event log in one scan of its key=value pairs.
+        
+        Args:
+            log_data: Log body
+            event_type: Event type value selecting the field table
+            
+        Returns:
+            Event data dictionary
+        """
+        values = dict(_EVENT_FIELD_PATTERN.findall(log_data))
+        event_data: Dict[str, Any] = {"event_type": event_type}
+        for field, key, convert, default in _TEXT_EVENT_FIELDS[event_type]:
+            value = values.get(key)
+            if value is None:
+                event_data[field] = default
+                continue
+            try:
+                event_data[field] = convert(value)
+            except ValueError:
+                # A malformed field (e.g. a non-numeric amount) falls back
+                # to its default instead of dropping the whole event
+                event_data[field] = default
+        event_data["timestamp"] = int(time.time())
+        return event_data
+    
     def _parse_create_event(self, log_data: str) -> Dict[str, Any]:
         """Parse create event from log data."""
-        # Implementation would depend on actual log format
-        return {
-            "event_type": PumpFunEventType.CREATE_EVENT.value,
-            "mint": "placeholder",  # Would extract from actual log
-            "name": "placeholder",
-            "symbol": "placeholder",
-            "uri": "placeholder",
-            "user": "placeholder",
-            "timestamp": int(time.time())
-        }
+        return self._parse_kv_event(log_data, _CREATE)
     
     def _parse_trade_event(self, log_data: str) -> Dict[str, Any]:
         """Parse trade event from log data."""
-        return {
-            "event_type": PumpFunEventType.TRADE_EVENT.value,
-            "mint": "placeholder",
-            "user": "placeholder",
-            "is_buy": True,
-            "sol_amount": 0,
-            "token_amount": 0,
-            "timestamp": int(time.time())
-        }
+        return self._parse_kv_event(log_data, _TRADE)
     
     def _parse_complete_event(self, log_data: str) -> Dict[str, Any]:
         """Parse complete event from log data."""
-        return {
-            "event_type": PumpFunEventType.COMPLETE_EVENT.value,
-            "mint": "placeholder",
-            "user": "placeholder",
-            "timestamp": int(time.time())
-        }
+        return self._parse_kv_event(log_data, _COMPLETE)
     
     def _create_event_object(self, event_type: str, event_data: Dict[str, Any]) -> Any:
         """
@@ -252,32 +665,10 @@ class EventManager:
         Returns:
             Event object
         """
-        if event_type == PumpFunEventType.CREATE_EVENT.value:
-            return CreateEvent(
-                mint=PublicKey(event_data["mint"]),
-                name=event_data["name"],
-                symbol=event_data["symbol"],
-                uri=event_data["uri"],
-                user=PublicKey(event_data["user"]),
-                timestamp=event_data["timestamp"]
-            )
-        elif event_type == PumpFunEventType.TRADE_EVENT.value:
-            return TradeEvent(
-                mint=PublicKey(event_data["mint"]),
-                user=PublicKey(event_data["user"]),
-                is_buy=event_data["is_buy"],
-                sol_amount=event_data["sol_amount"],
-                token_amount=event_data["token_amount"],
-                timestamp=event_data["timestamp"]
-            )
-        elif event_type == PumpFunEventType.COMPLETE_EVENT.value:
-            return CompleteEvent(
-                mint=PublicKey(event_data["mint"]),
-                user=PublicKey(event_data["user"]),
-                timestamp=event_data["timestamp"]
-            )
-        else:
+        ctor = _EVENT_CTORS.get(event_type)
+        if ctor is None:
             raise PumpFunError(f"Unknown event type: {event_type}")
+        return ctor(event_data)
     
     def _get_pump_fun_program_id(self) -> str:
         """
@@ -286,6 +677,5 @@ class EventManager:
         Returns:
             Program ID as string
         """
-        # This would be the actual PumpFun program ID
-        return "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"  # Placeholder
+        return PUMP_FUN_PROGRAM_ID
 
@@ -2,16 +2,113 @@
 Global account management for PumpDotFun SDK.
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import os
 import struct
-import base64
+import time
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from pathlib import Path
 from solana.publickey import PublicKey
 from solana.rpc.async_api import AsyncClient
-from .utils import PumpFunError, NetworkError
+from solana.rpc.websocket_api import connect
+from .websocket_hub import WebSocketHub
+from .types import RECORD_DATACLASS_OPTIONS, PUMP_FUN_PROGRAM_ID
+from .utils import PumpFunError, NetworkError, decode_account_bytes
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# PumpFun program and its b"global" PDA, derived offline with
+# PublicKey.find_program_address([b"global"], _KNOWN_PROGRAM_ID) (bump 255)
+_KNOWN_PROGRAM_ID = PublicKey(PUMP_FUN_PROGRAM_ID)
+_GLOBAL_PDA = PublicKey("4wTV1YmiEkRvAtNtsSGPtUrqRYQMe5SKy2uB4Jjaxnjf")
+
+# Anchor account discriminator preceding the account fields
+DISCRIMINATOR_SIZE = 8
+
+# Global account fields: initialized, authority, fee recipient, initial
+# virtual token/SOL reserves, initial real token reserves, total supply
+# and fee basis points
+_GLOBAL_ACCOUNT_STRUCT = struct.Struct('<?32s32sQQQQH')
+
+
+# Disk cache header: wall-clock time the raw account data was fetched
+_DISK_CACHE_HEADER = struct.Struct('<d')
+
+
+def default_cache_dir() -> Path:
+    """Directory for the persisted global account cache."""
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "pumpdotfun_sdk"
+
+
+def _endpoint_tag(rpc_client: AsyncClient) -> str:
+    """
+    Short hash of the RPC endpoint, so caches from different clusters
+    (e.g. devnet and mainnet) never share a file.
+    """
+    endpoint = getattr(getattr(rpc_client, "_provider", None), "endpoint_uri", None)
+    if not isinstance(endpoint, str):
+        endpoint = ""
+    return hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:16]
+
+
+def _account_data_bytes(data: Any) -> bytes:
+    """Normalize account data from RPC or websocket responses to raw bytes."""
+    if isinstance(data, (list, tuple)):
+        # RPC JSON form: [data, encoding]
+        return decode_account_bytes(data[0], data[1])
+    if isinstance(data, str):
+        return decode_account_bytes(data)
+    return data
+
+
+def parse_many(buffers: List[bytes]) -> List["GlobalAccountData"]:
+    """
+    Parse several raw global account buffers in one pass.
+    
+    The field runs of every buffer are packed back to back and decoded with
+    a single struct.iter_unpack call.
+    
+    Args:
+        buffers: Raw account data, discriminator included
+        
+    Returns:
+        Parsed global account data, in input order
+    """
+    end = DISCRIMINATOR_SIZE + _GLOBAL_ACCOUNT_STRUCT.size
+    if any(len(raw_data) < end for raw_data in buffers):
+        raise PumpFunError("Invalid global account data size")
+    
+    packed = b"".join(raw_data[DISCRIMINATOR_SIZE:end] for raw_data in buffers)
+    return [
+        GlobalAccountData(
+            initialized=initialized,
+            authority=PublicKey(authority_bytes),
+            fee_recipient=PublicKey(fee_recipient_bytes),
+            initial_virtual_token_reserves=initial_virtual_token_reserves,
+            initial_virtual_sol_reserves=initial_virtual_sol_reserves,
+            initial_real_token_reserves=initial_real_token_reserves,
+            token_total_supply=token_total_supply,
+            fee_basis_points=fee_basis_points
+        )
+        for (
+            initialized,
+            authority_bytes,
+            fee_recipient_bytes,
+            initial_virtual_token_reserves,
+            initial_virtual_sol_reserves,
+            initial_real_token_reserves,
+            token_total_supply,
+            fee_basis_points,
+        ) in _GLOBAL_ACCOUNT_STRUCT.iter_unpack(packed)
+    ]
+
+
+@dataclass(**RECORD_DATACLASS_OPTIONS)
 class GlobalAccountData:
     """
     Represents the global account data structure.
@@ -44,22 +141,48 @@ class GlobalAccountManager:
     Manages interactions with PumpFun's global account.
     """
     
-    def __init__(self, rpc_client: AsyncClient, program_id: PublicKey):
+    def __init__(
+        self,
+        rpc_client: AsyncClient,
+        program_id: PublicKey,
+        persist_cache: bool = False
+    ):
         """
         Initialize global account manager.
         
         Args:
             rpc_client: Solana RPC client
             program_id: PumpFun program ID
+            persist_cache: Keep the cached account on disk so a new process
+                can reuse it while it is younger than CACHE_DURATION
         """
         self.rpc_client = rpc_client
         self.program_id = program_id
-        self._global_account_address = None
         self._cached_data = None
         self._cache_timestamp = 0
+        # Created on first refresh so the manager can be built outside a loop
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._clock = time.monotonic
         
         # Cache settings
         self.CACHE_DURATION = 30  # seconds
+        self._cache_path: Optional[Path] = None
+        
+        if persist_cache:
+            self._cache_path = (
+                default_cache_dir() / f"global-{program_id}-{_endpoint_tag(rpc_client)}.bin"
+            )
+            self._load_disk_cache()
+    
+    @functools.cached_property
+    def global_account_address(self) -> PublicKey:
+        """Global account public key, derived once per manager."""
+        if self.program_id == _KNOWN_PROGRAM_ID:
+            return _GLOBAL_PDA
+        
+        # Derive global account address using PDA
+        address, _ = PublicKey.find_program_address([b"global"], self.program_id)
+        return address
     
     def get_global_account_address(self) -> PublicKey:
         """
@@ -68,13 +191,7 @@ class GlobalAccountManager:
         Returns:
             Global account public key
         """
-        if not self._global_account_address:
-            # Derive global account address using PDA
-            seeds = [b"global"]
-            address, _ = PublicKey.find_program_address(seeds, self.program_id)
-            self._global_account_address = address
-            
-        return self._global_account_address
+        return self.global_account_address
     
     async def fetch_global_account_data(
         self,
@@ -89,39 +206,79 @@ class GlobalAccountManager:
         Returns:
             Global account data
         """
-        import time
-        current_time = time.time()
-        
-        # Check cache
-        if (not force_refresh and 
-            self._cached_data and 
-            current_time - self._cache_timestamp < self.CACHE_DURATION):
+        # Hot cache: no lock taken
+        if not force_refresh and self._cache_is_fresh():
             return self._cached_data
         
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        
+        async with self._refresh_lock:
+            # Another task may have refreshed while we waited
+            if not force_refresh and self._cache_is_fresh():
+                return self._cached_data
+            
+            return await self._refresh()
+    
+    def _cache_is_fresh(self) -> bool:
+        """Check whether cached data is younger than CACHE_DURATION."""
+        return (
+            self._cached_data is not None and
+            self._clock() - self._cache_timestamp < self.CACHE_DURATION
+        )
+    
+    async def _refresh(self) -> GlobalAccountData:
+        """Fetch global account data and publish it to the cache."""
         try:
-            global_account_address = self.get_global_account_address()
+            global_account_address = self.global_account_address
             account_info = await self.rpc_client.get_account_info(global_account_address)
 
             if not account_info.value:
                 raise NetworkError("Global account not found")
 
-            raw_data = account_info.value.data
-            if isinstance(raw_data, (list, tuple)):
-                raw_data = base64.b64decode(raw_data[0])
-            elif isinstance(raw_data, str):
-                raw_data = base64.b64decode(raw_data)
-
+            raw_data = _account_data_bytes(account_info.value.data)
             data = self._parse_global_account_data(raw_data)
             
             # Update cache
             self._cached_data = data
-            self._cache_timestamp = current_time
+            self._cache_timestamp = self._clock()
+            
+            if self._cache_path:
+                self._save_disk_cache(raw_data)
             
             return data
             
         except Exception as e:
             raise NetworkError(f"Failed to fetch global account data: {e}")
     
+    def _load_disk_cache(self) -> None:
+        """Seed the in-memory cache from disk if the entry is still fresh."""
+        try:
+            payload = self._cache_path.read_bytes()
+            (fetched_at,) = _DISK_CACHE_HEADER.unpack_from(payload)
+            age = time.time() - fetched_at
+            if not 0 <= age < self.CACHE_DURATION:
+                return
+            
+            self._cached_data = self._parse_global_account_data(
+                payload[_DISK_CACHE_HEADER.size:]
+            )
+            self._cache_timestamp = self._clock() - age
+        except (OSError, struct.error, PumpFunError):
+            # Missing or corrupt cache: fall back to the RPC
+            pass
+    
+    def _save_disk_cache(self, raw_data: bytes) -> None:
+        """Atomically write the raw account data with its fetch time."""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(_DISK_CACHE_HEADER.pack(time.time()) + raw_data)
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            # Persistence is best effort
+            pass
+    
     def _parse_global_account_data(self, raw_data: bytes) -> GlobalAccountData:
         """
         Parse raw global account data.
@@ -133,51 +290,24 @@ class GlobalAccountManager:
             Parsed global account data
         """
         try:
-            # This is a placeholder implementation
-            # The actual parsing would depend on PumpFun's account structure
-            
-            # Assuming a simple structure for demonstration
-            if len(raw_data) < 100:  # Minimum expected size
+            if len(raw_data) < DISCRIMINATOR_SIZE + _GLOBAL_ACCOUNT_STRUCT.size:
                 raise PumpFunError("Invalid global account data size")
             
-            # Parse fields (this would need to match actual PumpFun structure)
-            offset = 0
-            
-            # Discriminator (8 bytes)
-            offset += 8
-            
-            # Initialized flag (1 byte)
-            initialized = bool(raw_data[offset])
-            offset += 1
-            
-            # Authority (32 bytes)
-            authority = PublicKey(raw_data[offset:offset + 32])
-            offset += 32
-            
-            # Fee recipient (32 bytes)
-            fee_recipient = PublicKey(raw_data[offset:offset + 32])
-            offset += 32
-            
-            # Various reserves and supply values (8 bytes each)
-            initial_virtual_token_reserves = struct.unpack('<Q', raw_data[offset:offset + 8])[0]
-            offset += 8
-            
-            initial_virtual_sol_reserves = struct.unpack('<Q', raw_data[offset:offset + 8])[0]
-            offset += 8
-            
-            initial_real_token_reserves = struct.unpack('<Q', raw_data[offset:offset + 8])[0]
-            offset += 8
-            
-            token_total_supply = struct.unpack('<Q', raw_data[offset:offset + 8])[0]
-            offset += 8
-            
-            # Fee basis points (2 bytes)
-            fee_basis_points = struct.unpack('<H', raw_data[offset:offset + 2])[0]
+            (
+                initialized,
+                authority_bytes,
+                fee_recipient_bytes,
+                initial_virtual_token_reserves,
+                initial_virtual_sol_reserves,
+                initial_real_token_reserves,
+                token_total_supply,
+                fee_basis_points,
+            ) = _GLOBAL_ACCOUNT_STRUCT.unpack_from(raw_data, DISCRIMINATOR_SIZE)
             
             return GlobalAccountData(
                 initialized=initialized,
-                authority=authority,
-                fee_recipient=fee_recipient,
+                authority=PublicKey(authority_bytes),
+                fee_recipient=PublicKey(fee_recipient_bytes),
                 initial_virtual_token_reserves=initial_virtual_token_reserves,
                 initial_virtual_sol_reserves=initial_virtual_sol_reserves,
                 initial_real_token_reserves=initial_real_token_reserves,
@@ -293,15 +423,7 @@ class ProgramConfigManager:
             Bonding curve configuration
         """
         if "bonding_curve" not in self._config_cache:
-            global_data = await self.global_manager.fetch_global_account_data()
-            
-            self._config_cache["bonding_curve"] = {
-                "virtual_token_reserves": global_data.initial_virtual_token_reserves,
-                "virtual_sol_reserves": global_data.initial_virtual_sol_reserves,
-                "real_token_reserves": global_data.initial_real_token_reserves,
-                "token_total_supply": global_data.token_total_supply,
-                "completion_threshold": global_data.initial_virtual_sol_reserves,  # When curve completes
-            }
+            await self._rebuild_all()
         
         return self._config_cache["bonding_curve"]
     
@@ -313,14 +435,7 @@ class ProgramConfigManager:
             Trading configuration
         """
         if "trading" not in self._config_cache:
-            global_data = await self.global_manager.fetch_global_account_data()
-            
-            self._config_cache["trading"] = {
-                "fee_basis_points": global_data.fee_basis_points,
-                "fee_recipient": str(global_data.fee_recipient),
-                "minimum_trade_amount": 1000,  # Minimum lamports
-                "maximum_slippage": 5000,  # 50% in basis points
-            }
+            await self._rebuild_all()
         
         return self._config_cache["trading"]
     
@@ -332,18 +447,42 @@ class ProgramConfigManager:
             Token creation configuration
         """
         if "token_creation" not in self._config_cache:
-            global_data = await self.global_manager.fetch_global_account_data()
-            
-            self._config_cache["token_creation"] = {
+            await self._rebuild_all()
+        
+        return self._config_cache["token_creation"]
+    
+    async def _rebuild_all(self, force_refresh: bool = False) -> None:
+        """
+        Derive every configuration from a single global account fetch.
+        
+        Args:
+            force_refresh: Bypass the global account cache
+        """
+        global_data = await self.global_manager.fetch_global_account_data(force_refresh=force_refresh)
+        
+        self._config_cache = {
+            "bonding_curve": {
+                "virtual_token_reserves": global_data.initial_virtual_token_reserves,
+                "virtual_sol_reserves": global_data.initial_virtual_sol_reserves,
+                "real_token_reserves": global_data.initial_real_token_reserves,
+                "token_total_supply": global_data.token_total_supply,
+                "completion_threshold": global_data.initial_virtual_sol_reserves,  # When curve completes
+            },
+            "trading": {
+                "fee_basis_points": global_data.fee_basis_points,
+                "fee_recipient": str(global_data.fee_recipient),
+                "minimum_trade_amount": 1000,  # Minimum lamports
+                "maximum_slippage": 5000,  # 50% in basis points
+            },
+            "token_creation": {
                 "authority": str(global_data.authority),
                 "default_decimals": 6,
                 "metadata_required_fields": ["name", "symbol", "description", "image"],
                 "maximum_name_length": 32,
                 "maximum_symbol_length": 10,
                 "maximum_description_length": 500,
-            }
-        
-        return self._config_cache["token_creation"]
+            },
+        }
     
     def clear_config_cache(self) -> None:
         """Clear configuration cache."""
@@ -351,10 +490,7 @@ class ProgramConfigManager:
     
     async def refresh_all_configs(self) -> None:
         """Refresh all cached configurations."""
-        self.clear_config_cache()
-        await self.get_bonding_curve_config()
-        await self.get_trading_config()
-        await self.get_token_creation_config()
+        await self._rebuild_all(force_refresh=True)
 
 
 class AccountMonitor:
@@ -362,16 +498,28 @@ class AccountMonitor:
     Monitors global account changes.
     """
     
-    def __init__(self, global_account_manager: GlobalAccountManager):
+    def __init__(
+        self,
+        global_account_manager: GlobalAccountManager,
+        websocket_url: Optional[str] = None,
+        hub: Optional[WebSocketHub] = None
+    ):
         """
         Initialize account monitor.
         
         Args:
             global_account_manager: Global account manager instance
+            websocket_url: WebSocket URL for account change notifications
+                (optional; without it the monitor falls back to polling)
+            hub: Optional shared websocket hub; takes precedence over
+                websocket_url so the subscription shares its connection
         """
         self.global_manager = global_account_manager
+        self.websocket_url = websocket_url
+        self.hub = hub
         self.monitoring = False
         self.callbacks = []
+        self._stopped: Optional[asyncio.Event] = None
     
     def add_change_callback(self, callback) -> None:
         """
@@ -382,16 +530,34 @@ class AccountMonitor:
         """
         self.callbacks.append(callback)
     
-    async def start_monitoring(self, interval: int = 30) -> None:
+    async def start_monitoring(
+        self,
+        interval: int = 30,
+        prefer_subscribe: bool = True
+    ) -> None:
         """
         Start monitoring global account changes.
         
+        With a websocket URL configured, the monitor subscribes to the
+        global account and only decodes data when the node pushes an
+        update. Otherwise, or with prefer_subscribe=False, it polls.
+        
         Args:
-            interval: Check interval in seconds
+            interval: Poll interval in seconds; also the reconnect delay
+                for the subscription
+            prefer_subscribe: Use accountSubscribe when a websocket URL is set
         """
-        import asyncio
-        
         self.monitoring = True
+        
+        if prefer_subscribe and self.hub:
+            await self._hub_loop()
+        elif prefer_subscribe and self.websocket_url:
+            await self._subscribe_loop(interval)
+        else:
+            await self._poll_loop(interval)
+    
+    async def _poll_loop(self, interval: int) -> None:
+        """Poll the global account and diff against the previous value."""
         last_data = None
         
         while self.monitoring:
@@ -400,20 +566,126 @@ class AccountMonitor:
                 
                 if last_data and current_data != last_data:
                     # Account changed, notify callbacks
-                    for callback in self.callbacks:
-                        try:
-                            await callback(current_data, last_data)
-                        except Exception as e:
-                            print(f"Error in change callback: {e}")
+                    await self._notify(current_data, last_data)
                 
                 last_data = current_data
                 await asyncio.sleep(interval)
                 
             except Exception as e:
-                print(f"Error monitoring global account: {e}")
+                logger.error("Error monitoring global account: %s", e)
                 await asyncio.sleep(interval)
     
+    async def _subscribe_loop(self, reconnect_delay: int) -> None:
+        """Receive global account updates pushed over accountSubscribe."""
+        address = self.global_manager.global_account_address
+        last_data = None
+        
+        try:
+            last_data = await self.global_manager.fetch_global_account_data(force_refresh=True)
+        except Exception as e:
+            logger.error("Error fetching initial global account: %s", e)
+        
+        while self.monitoring:
+            try:
+                async with connect(self.websocket_url) as websocket:
+                    await websocket.account_subscribe(
+                        address, commitment="confirmed", encoding="base64"
+                    )
+                    
+                    async for messages in websocket:
+                        if not self.monitoring:
+                            break
+                        
+                        if not isinstance(messages, list):
+                            messages = [messages]
+                        
+                        for message in messages:
+                            # Subscription confirmations carry no account value
+                            value = getattr(getattr(message, "result", None), "value", None)
+                            if value is None:
+                                continue
+                            
+                            current_data = self.global_manager._parse_global_account_data(
+                                _account_data_bytes(value.data)
+                            )
+                            
+                            if last_data and current_data != last_data:
+                                await self._notify(current_data, last_data)
+                            
+                            last_data = current_data
+                            
+            except Exception as e:
+                logger.error("Error in global account subscription: %s", e)
+            
+            # Also wait after a clean close so a closing server is not hammered
+            if self.monitoring:
+                await asyncio.sleep(reconnect_delay)
+    
+    async def _hub_loop(self) -> None:
+        """Receive global account updates through the shared websocket hub."""
+        # Created before any await so stop_monitoring() during the initial
+        # fetch is not lost
+        self._stopped = asyncio.Event()
+        last_data = None
+        
+        try:
+            last_data = await self.global_manager.fetch_global_account_data(force_refresh=True)
+        except Exception as e:
+            logger.error("Error fetching initial global account: %s", e)
+        
+        if not self.monitoring:
+            return
+        
+        async def on_notification(params: Dict[str, Any]) -> None:
+            nonlocal last_data
+            value = params.get("result", {}).get("value")
+            if not value or not self.monitoring:
+                return
+            
+            current_data = self.global_manager._parse_global_account_data(
+                _account_data_bytes(value["data"])
+            )
+            
+            if last_data and current_data != last_data:
+                await self._notify(current_data, last_data)
+            
+            last_data = current_data
+        
+        subscription_id = await self.hub.subscribe_account(
+            self.global_manager.global_account_address, on_notification
+        )
+        try:
+            # The hub reconnects on its own; just wait for stop_monitoring()
+            await self._stopped.wait()
+        finally:
+            await self.hub.unsubscribe(subscription_id)
+    
+    async def _notify(
+        self,
+        current_data: GlobalAccountData,
+        last_data: GlobalAccountData
+    ) -> None:
+        """Run all change callbacks concurrently."""
+        await asyncio.gather(
+            *(self._run_callback(callback, current_data, last_data) for callback in self.callbacks)
+        )
+    
+    @staticmethod
+    async def _run_callback(
+        callback,
+        current_data: GlobalAccountData,
+        last_data: GlobalAccountData
+    ) -> None:
+        """Run one change callback, isolating its errors."""
+        try:
+            result = callback(current_data, last_data)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error("Error in change callback: %s", e)
+    
     def stop_monitoring(self) -> None:
         """Stop monitoring."""
         self.monitoring = False
-
+        if self._stopped:
+            self._stopped.set()
@@ -2,11 +2,19 @@
 Type definitions for PumpDotFun SDK.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from enum import Enum
+from solana.keypair import Keypair
 from solana.publickey import PublicKey
 
+# Options for high-volume immutable records: frozen, plus __slots__ where
+# dataclasses support it (Python 3.10+)
+RECORD_DATACLASS_OPTIONS: Dict[str, bool] = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
+
 
 @dataclass
 class CreateTokenMetadata:
@@ -51,7 +59,7 @@ class BackendType(Enum):
     ON_CHAIN = "on_chain"
 
 
-@dataclass
+@dataclass(**RECORD_DATACLASS_OPTIONS)
 class CreateEvent:
     """Token creation event."""
     mint: PublicKey
@@ -62,7 +70,7 @@ class CreateEvent:
     timestamp: int
 
 
-@dataclass
+@dataclass(**RECORD_DATACLASS_OPTIONS)
 class TradeEvent:
     """Trade event."""
     mint: PublicKey
@@ -73,7 +81,7 @@ class TradeEvent:
     timestamp: int
 
 
-@dataclass
+@dataclass(**RECORD_DATACLASS_OPTIONS)
 class CompleteEvent:
     """Completion event."""
     mint: PublicKey
@@ -83,6 +91,7 @@ class CompleteEvent:
 
 # Type aliases
 EventCallback = Callable[[Any, int, str], None]
+BatchEventCallback = Callable[[List[Tuple[Any, int, str]]], None]
 Commitment = str
 Finality = str
 
@@ -91,4 +100,22 @@ DEFAULT_COMMITMENT = "confirmed"
 DEFAULT_FINALITY = "confirmed"
 DEFAULT_SLIPPAGE_BASIS_POINTS = 500
 LAMPORTS_PER_SOL = 1_000_000_000
+PUMP_FUN_PROGRAM_ID = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
 
+@dataclass
+class BuyOrder:
+    """A single buy in a batched buy_many call."""
+    buyer: Keypair
+    mint: PublicKey
+    buy_amount_sol: float
+    slippage_basis_points: int = DEFAULT_SLIPPAGE_BASIS_POINTS
+
+
+@dataclass
+class SellOrder:
+    """A single sell in a batched sell_many call."""
+    seller: Keypair
+    mint: PublicKey
+    sell_token_amount: int
+    slippage_basis_points: int = DEFAULT_SLIPPAGE_BASIS_POINTS
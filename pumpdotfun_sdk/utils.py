@@ -3,10 +3,12 @@ Utility functions for PumpDotFun SDK.
 """
 
 import json
-import base64
+import sys
 import time
 import logging
-from typing import Dict, Any, Optional
+import weakref
+from binascii import a2b_base64
+from typing import Dict, Any, Optional, List, Set, Tuple, Union, Iterable
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment as SolanaCommitment
 from .types import CreateTokenMetadata, LAMPORTS_PER_SOL
@@ -14,6 +16,45 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize to JSON bytes.
+    
+    orjson, when installed, gives compact output; without it the output is
+    exactly json.dumps, as before the speedups extra existed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson.JSONEncodeError, e.g. integers wider than 64 bits,
+            # which the stdlib encoder accepts
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+# (JSON key, CreateTokenMetadata attribute) for fields always written
+_METADATA_FIELDS = (
+    ("name", "name"),
+    ("symbol", "symbol"),
+    ("description", "description"),
+    ("image", "image"),
+    ("showName", "show_name"),
+)
+
+# Optional social links, written only when set
+_OPTIONAL_METADATA_FIELDS = (
+    ("twitter", "twitter"),
+    ("telegram", "telegram"),
+    ("website", "website"),
+)
+
 
 def create_metadata_uri(metadata: CreateTokenMetadata) -> str:
     """
@@ -25,24 +66,24 @@ def create_metadata_uri(metadata: CreateTokenMetadata) -> str:
     Returns:
         JSON string representation of metadata
     """
-    metadata_dict = {
-        "name": metadata.name,
-        "symbol": metadata.symbol,
-        "description": metadata.description,
-        "image": metadata.image,
-        "showName": metadata.show_name,
-        "createdOn": metadata.created_on or str(int(time.time())),
-    }
+    metadata_dict = {key: getattr(metadata, attr) for key, attr in _METADATA_FIELDS}
+    metadata_dict["createdOn"] = metadata.created_on or str(int(time.time()))
     
     # Add optional social links
-    if metadata.twitter:
-        metadata_dict["twitter"] = metadata.twitter
-    if metadata.telegram:
-        metadata_dict["telegram"] = metadata.telegram
-    if metadata.website:
-        metadata_dict["website"] = metadata.website
-        
-    return json.dumps(metadata_dict)
+    metadata_dict.update(
+        (key, value)
+        for key, attr in _OPTIONAL_METADATA_FIELDS
+        if (value := getattr(metadata, attr))
+    )
+    
+    return _dumps(metadata_dict).decode("utf-8")
+
+
+# Powers of ten for token decimals; SPL decimals fit in a u8 but are <= 18 in practice
+_POW10 = tuple(10 ** d for d in range(39))
+
+# Float divisor so conversions skip the int -> float promotion per call
+_LAMPORTS_PER_SOL_FLOAT = float(LAMPORTS_PER_SOL)
 
 
 def validate_slippage(slippage_basis_points: int) -> bool:
@@ -68,7 +109,7 @@ def format_sol_amount(lamports: int) -> float:
     Returns:
         Amount in SOL
     """
-    return lamports / LAMPORTS_PER_SOL
+    return lamports / _LAMPORTS_PER_SOL_FLOAT
 
 
 def format_token_amount(raw_amount: int, decimals: int) -> float:
@@ -82,6 +123,8 @@ def format_token_amount(raw_amount: int, decimals: int) -> float:
     Returns:
         Formatted token amount
     """
+    if 0 <= decimals < len(_POW10):
+        return raw_amount / _POW10[decimals]
     return raw_amount / (10 ** decimals)
 
 
@@ -95,14 +138,65 @@ def sol_to_lamports(sol_amount: float) -> int:
     Returns:
         Amount in lamports
     """
-    return int(sol_amount * LAMPORTS_PER_SOL)
+    return int(sol_amount * _LAMPORTS_PER_SOL_FLOAT)
+
+
+def _numpy() -> Any:
+    """
+    The numpy module if it has been imported, else None.
+    
+    An ndarray argument means the caller already imported numpy, so the
+    batch helpers never import it themselves and SDK import stays light.
+    """
+    return sys.modules.get("numpy")
+
+
+def sol_to_lamports_batch(sol_amounts: Iterable[float]) -> Any:
+    """
+    Convert many SOL amounts to lamports.
+    
+    NumPy arrays are converted in one vectorized operation and returned as
+    an int64 array; any other iterable gives a list.
+    
+    Args:
+        sol_amounts: Amounts in SOL
+        
+    Returns:
+        Amounts in lamports, truncated like sol_to_lamports
+    """
+    np = _numpy()
+    if np is not None and isinstance(sol_amounts, np.ndarray):
+        return (sol_amounts * _LAMPORTS_PER_SOL_FLOAT).astype(np.int64)
+    return [int(amount * _LAMPORTS_PER_SOL_FLOAT) for amount in sol_amounts]
+
+
+def format_sol_amount_batch(lamports: Iterable[int]) -> Any:
+    """
+    Convert many lamport amounts to SOL.
+    
+    NumPy arrays are converted in one vectorized operation and returned as
+    a float64 array; any other iterable gives a list.
+    
+    Args:
+        lamports: Amounts in lamports
+        
+    Returns:
+        Amounts in SOL
+    """
+    np = _numpy()
+    if np is not None and isinstance(lamports, np.ndarray):
+        return lamports / _LAMPORTS_PER_SOL_FLOAT
+    return [amount / _LAMPORTS_PER_SOL_FLOAT for amount in lamports]
 
 
 async def wait_for_confirmation(
     rpc_client: AsyncClient,
     signature: str,
     commitment: str = "confirmed",
-    timeout: int = 60
+    timeout: int = 60,
+    initial_interval: float = 0.05,
+    max_interval: float = 1.0,
+    backoff: float = 1.5
 ) -> bool:
     """
     Wait for transaction confirmation.
@@ -112,41 +206,293 @@ async def wait_for_confirmation(
         signature: Transaction signature
         commitment: Commitment level
         timeout: Timeout in seconds
+        initial_interval: First delay between status polls in seconds
+        max_interval: Upper bound for the poll delay in seconds
+        backoff: Factor applied to the delay after each poll
+        
+    Returns:
+        True if confirmed, False if the transaction failed or timed out
+    """
+    confirmed = await wait_for_confirmations(
+        rpc_client, [signature], commitment, timeout,
+        initial_interval, max_interval, backoff
+    )
+    return confirmed[0]
+
+
+async def wait_for_confirmations(
+    rpc_client: AsyncClient,
+    signatures: List[str],
+    commitment: str = "confirmed",
+    timeout: int = 60,
+    initial_interval: float = 0.05,
+    max_interval: float = 1.0,
+    backoff: float = 1.5
+) -> List[bool]:
+    """
+    Wait for several transactions, polling all statuses in one request.
+    
+    Polling starts at initial_interval and backs off exponentially up to
+    max_interval, so fast confirmations are seen quickly without hammering
+    the RPC on slow ones. A transaction that failed on chain stops being
+    polled immediately.
+    
+    Args:
+        rpc_client: Solana RPC client
+        signatures: Transaction signatures
+        commitment: Commitment level
+        timeout: Timeout in seconds
+        initial_interval: First delay between status polls in seconds
+        max_interval: Upper bound for the poll delay in seconds
+        backoff: Factor applied to the delay after each poll
         
     Returns:
-        True if confirmed, False if timeout
+        Confirmation flag for each signature, in input order
     """
-    start_time = time.time()
+    target_rank = _COMMITMENT_RANK.get(commitment)
+    if target_rank is None:
+        raise ValidationError(f"Unknown commitment level: {commitment}")
+
+    confirmed = [False] * len(signatures)
+    # Confirmed or failed: either way no longer polled
+    settled = [False] * len(signatures)
+    interval = initial_interval
+    # Monotonic so clock adjustments cannot cut the wait short
+    deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
     
-    while time.time() - start_time < timeout:
+    while time.monotonic_ns() < deadline_ns:
+        pending = [i for i, done in enumerate(settled) if not done]
+        if not pending:
+            break
+
+        # Lookups from every concurrent waiter on this client share one RPC;
+        # a stalled request is bounded by the time left, and less time left
+        # than the batching window sends the lookups without waiting for it
+        remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+        batcher = get_signature_batcher(rpc_client)
         try:
-            response = await rpc_client.get_signature_statuses([signature])
+            statuses = await asyncio.wait_for(
+                asyncio.gather(
+                    *(batcher.lookup(signatures[i], max_wait=remaining) for i in pending),
+                    return_exceptions=True
+                ),
+                timeout=remaining
+            )
+        except asyncio.TimeoutError:
+            break
+        
+        for i, status in zip(pending, statuses):
+            if isinstance(status, Exception):
+                # Retried next round; the other lookups are still good
+                logger.warning("Error checking transaction status: %s", status)
+                continue
+            if not status:
+                continue
+            if getattr(status, "err", None):
+                settled[i] = True
+            elif _is_confirmed(status, target_rank):
+                confirmed[i] = settled[i] = True
+
+        if all(settled):
+            break
             
-            if response.value and response.value[0]:
-                status = response.value[0]
-                confirm_status = getattr(status, "confirmation_status", None)
-                if confirm_status:
-                    if isinstance(confirm_status, str):
-                        confirm_status = confirm_status.lower()
-                    else:
-                        text = str(confirm_status)
-                        confirm_status = text.split(".")[-1].lower()
-                    try:
-                        levels = ["processed", "confirmed", "finalized"]
-                        status_level = levels.index(confirm_status)
-                        required_level = levels.index(SolanaCommitment(commitment))
-                        if status_level >= required_level:
-                            return True
-                    except ValueError:
-                        logger.warning(
-                            f"Unknown confirmation status: {confirm_status}"
-                        )
-        except Exception as e:
-            logger.warning(f"Error checking transaction status: {e}")
+        await asyncio.sleep(interval)
+        interval = min(interval * backoff, max_interval)
+        
+    return confirmed
+
+
+# Commitment levels ordered by finality
+_COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+def _commitment_rank(confirm_status: Any) -> int:
+    """Rank a confirmation status given as a string or a solders enum, -1 if unknown."""
+    rank = _COMMITMENT_RANK.get(confirm_status)
+    if rank is None:
+        # e.g. "Finalized" or TransactionConfirmationStatus.Finalized
+        text = getattr(confirm_status, "value", None) or str(confirm_status)
+        rank = _COMMITMENT_RANK.get(text.split(".")[-1].lower(), -1)
+    return rank
+
+
+def _is_confirmed(status: Any, target_rank: int) -> bool:
+    """Check whether a signature status has reached the target commitment rank."""
+    confirm_status = getattr(status, "confirmation_status", None)
+    if not confirm_status:
+        return False
+
+    rank = _commitment_rank(confirm_status)
+    if rank < 0:
+        logger.warning("Unknown confirmation status: %s", confirm_status)
+        return False
+    return rank >= target_rank
+
+
+class SignatureStatusBatcher:
+    """
+    Coalesces signature status lookups from concurrent waiters.
+    
+    Lookups arriving within a short window are sent as one
+    get_signature_statuses request (up to MAX_BATCH signatures), and each
+    waiter receives the status for its own signature.
+    """
+    
+    # getSignatureStatuses accepts at most 256 signatures
+    MAX_BATCH = 256
+    
+    def __init__(self, rpc_client: AsyncClient, window: float = 0.02):
+        """
+        Initialize signature status batcher.
+        
+        Args:
+            rpc_client: Solana RPC client
+            window: Seconds to wait for more lookups before sending
+        """
+        # Weak so the batcher registry does not keep closed clients alive
+        self._rpc_client = weakref.ref(rpc_client)
+        self.window = window
+        self._queue: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to in-flight requests
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def lookup(self, signature: str, max_wait: Optional[float] = None) -> Any:
+        """
+        Get the status of a signature.
+        
+        Args:
+            signature: Transaction signature
+            max_wait: Seconds the caller can still wait; when shorter than
+                the window, queued lookups are sent right away
             
-        await asyncio.sleep(1)
+        Returns:
+            Signature status, or None if the node does not know it
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((signature, future))
+        
+        if len(self._queue) >= self.MAX_BATCH or (
+            max_wait is not None and max_wait < self.window
+        ):
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Send queued lookups, MAX_BATCH signatures per request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
-    return False
+        while self._queue:
+            batch = self._queue[:self.MAX_BATCH]
+            del self._queue[:self.MAX_BATCH]
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Issue one get_signature_statuses call and resolve its waiters."""
+        try:
+            rpc_client = self._rpc_client()
+            if rpc_client is None:
+                raise NetworkError("RPC client was released")
+            response = await rpc_client.get_signature_statuses(
+                [signature for signature, _ in batch]
+            )
+            values = list(response.value or [])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        values += [None] * (len(batch) - len(values))
+        for (_, future), status in zip(batch, values):
+            if not future.done():
+                future.set_result(status)
+
+
+# One batcher per RPC client, released with the client
+_SIGNATURE_BATCHERS: "weakref.WeakKeyDictionary[Any, SignatureStatusBatcher]" = weakref.WeakKeyDictionary()
+
+
+def get_signature_batcher(rpc_client: AsyncClient) -> SignatureStatusBatcher:
+    """
+    Get the shared signature status batcher for an RPC client.
+    
+    Args:
+        rpc_client: Solana RPC client
+        
+    Returns:
+        Batcher bound to the client
+    """
+    batcher = _SIGNATURE_BATCHERS.get(rpc_client)
+    if batcher is None:
+        batcher = _SIGNATURE_BATCHERS[rpc_client] = SignatureStatusBatcher(rpc_client)
+    return batcher
+
+
+# Shared RPC clients: event loop -> {(endpoint, commitment): client}.
+# Keyed by loop because pooled connections belong to the loop that opened them.
+_SHARED_RPC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_rpc_client(endpoint: str, commitment: str = "confirmed") -> AsyncClient:
+    """
+    Get a pooled RPC client for an endpoint.
+    
+    Clients are memoized per running event loop, so repeated callers reuse
+    one keep-alive connection pool instead of paying a new TCP and TLS
+    handshake each time. Must be called from a coroutine.
+    
+    Args:
+        endpoint: Solana RPC endpoint URL
+        commitment: Default commitment level
+        
+    Returns:
+        Shared RPC client; close with close_shared_rpc_clients()
+    """
+    clients = _SHARED_RPC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (endpoint, commitment)
+    
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = AsyncClient(endpoint, commitment=SolanaCommitment(commitment))
+    return client
+
+
+async def close_shared_rpc_clients() -> None:
+    """Close the pooled RPC clients of the running event loop."""
+    clients = _SHARED_RPC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when it is available.
+
+    Call this once at program start, before the event loop is created.
+    uvloop noticeably lowers scheduling overhead for bots issuing many
+    trades or consuming busy event streams.
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    return True
 
 
 def calculate_slippage_amount(
@@ -163,14 +509,51 @@ def calculate_slippage_amount(
         is_minimum: If True, calculate minimum amount; if False, calculate maximum
         
     Returns:
-        Amount with slippage applied
+        Amount with slippage applied, rounded down
     """
-    slippage_multiplier = slippage_basis_points / 10000
-    
+    # Exact integer math: float multipliers lose precision on lamport and
+    # raw token amounts above 2**53. Float amounts are truncated first so
+    # the result is always an int
+    expected_amount = int(expected_amount)
     if is_minimum:
-        return int(expected_amount * (1 - slippage_multiplier))
+        return expected_amount * (10000 - slippage_basis_points) // 10000
     else:
-        return int(expected_amount * (1 + slippage_multiplier))
+        return expected_amount * (10000 + slippage_basis_points) // 10000
+
+
+def calculate_slippage_amount_batch(
+    expected_amounts: Iterable[int],
+    slippage_basis_points: int,
+    is_minimum: bool = True
+) -> Any:
+    """
+    Apply the same slippage to many amounts.
+    
+    NumPy integer arrays are computed in one vectorized operation when the
+    intermediate product fits in int64, and returned as an array; anything
+    else is computed with exact Python integers and returned as a list.
+    
+    Args:
+        expected_amounts: Expected amounts
+        slippage_basis_points: Slippage in basis points
+        is_minimum: If True, calculate minimum amounts; if False, calculate maximums
+        
+    Returns:
+        Amounts with slippage applied, rounded down
+    """
+    factor = 10000 - slippage_basis_points if is_minimum else 10000 + slippage_basis_points
+    np = _numpy()
+    if (
+        np is not None
+        and isinstance(expected_amounts, np.ndarray)
+        and expected_amounts.dtype.kind in "iu"
+        and (
+            expected_amounts.size == 0
+            or int(expected_amounts.max()) <= np.iinfo(np.int64).max // max(factor, 1)
+        )
+    ):
+        return expected_amounts.astype(np.int64) * factor // 10000
+    return [int(amount) * factor // 10000 for amount in expected_amounts]
 
 
 def encode_instruction_data(data: Dict[str, Any]) -> bytes:
@@ -185,25 +568,45 @@ def encode_instruction_data(data: Dict[str, Any]) -> bytes:
     """
     # This would need to be implemented based on the specific
     # instruction format used by PumpFun
-    return json.dumps(data).encode('utf-8')
+    return _dumps(data)
 
 
-def decode_account_data(data: str) -> Dict[str, Any]:
+def decode_account_bytes(data: Union[str, bytes], encoding: str = "base64") -> bytes:
+    """
+    Decode account data to raw bytes.
+    
+    Args:
+        data: Encoded account data, as ASCII text or bytes
+        encoding: Encoding reported by the RPC alongside the data
+        
+    Returns:
+        Raw account bytes
+    """
+    if encoding != "base64":
+        raise ValidationError(f"Unsupported account data encoding: {encoding}")
+    # The C decoder b64decode wraps, without its argument coercion
+    return a2b_base64(data)
+
+
+def decode_account_data(data: Union[str, bytes]) -> Dict[str, Any]:
     """
     Decode account data from base64.
     
+    Prefer decode_account_bytes when only the raw bytes are needed.
+    
     Args:
-        data: Base64 encoded account data
+        data: Base64 encoded account data, as ASCII text or bytes
         
     Returns:
         Decoded data dictionary
     """
     try:
-        decoded_bytes = base64.b64decode(data)
         # This would need specific parsing based on PumpFun's account structure
-        return {"raw_data": decoded_bytes}
-    except Exception as e:
-        logger.error(f"Error decoding account data: {e}")
+        return {"raw_data": decode_account_bytes(data)}
+    except (ValueError, TypeError) as e:
+        # binascii.Error for malformed base64, ValueError for non-ASCII
+        # text, TypeError for input that is neither str nor bytes
+        logger.error("Error decoding account data: %s", e)
         return {}
 
 
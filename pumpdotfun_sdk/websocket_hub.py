@@ -0,0 +1,259 @@
+"""
+Shared websocket connection for PumpDotFun SDK.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import weakref
+from typing import Dict, Callable, Any, Optional, List, Iterable, Tuple
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+# Receives the "params" object of a Solana pubsub notification
+NotificationCallback = Callable[[Dict[str, Any]], Any]
+
+# Shared hubs: event loop -> {websocket_url: hub}
+_SHARED_HUBS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, WebSocketHub]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class WebSocketHub:
+    """
+    Multiplexes Solana pubsub subscriptions over a single websocket.
+
+    Every subscription is recorded so it can be re-issued after a
+    reconnect, and notifications are routed to callbacks by subscription id.
+    """
+
+    # Reconnect backoff bounds in seconds
+    INITIAL_BACKOFF = 1.0
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, websocket_url: str):
+        """
+        Initialize websocket hub.
+
+        Args:
+            websocket_url: WebSocket URL of the Solana RPC node
+        """
+        self.websocket_url = websocket_url
+        self._ws = None
+        self._running = False
+        self._reader_task: Optional[asyncio.Task] = None
+        self._next_id = 1
+        self._next_request_id = 1
+        # Local id -> (subscribe method, params, callback)
+        self._subscriptions: Dict[int, Tuple[str, List[Any], NotificationCallback]] = {}
+        # Server subscription id -> local id, valid for the current connection
+        self._server_ids: Dict[int, int] = {}
+        # Pending subscribe request id -> local id
+        self._pending: Dict[int, int] = {}
+
+    @classmethod
+    def shared(cls, websocket_url: str) -> "WebSocketHub":
+        """
+        Get the hub shared by every caller on the running event loop.
+        
+        One connection is kept per websocket URL; it closes when its last
+        subscription is removed and reopens on the next subscribe.
+        
+        Args:
+            websocket_url: WebSocket URL of the Solana RPC node
+            
+        Returns:
+            Shared hub for the URL
+        """
+        hubs = _SHARED_HUBS.setdefault(asyncio.get_running_loop(), {})
+        hub = hubs.get(websocket_url)
+        if hub is None:
+            hub = hubs[websocket_url] = cls(websocket_url)
+        return hub
+
+    async def subscribe_logs(
+        self,
+        mentions: Iterable[str],
+        callback: NotificationCallback,
+        commitment: str = "confirmed"
+    ) -> int:
+        """
+        Subscribe to transaction logs mentioning the given addresses.
+
+        Args:
+            mentions: Addresses to filter logs by
+            callback: Called with each notification's params
+            commitment: Commitment level
+
+        Returns:
+            Subscription ID
+        """
+        params = [{"mentions": list(mentions)}, {"commitment": commitment}]
+        return await self._subscribe("logsSubscribe", params, callback)
+
+    async def subscribe_account(
+        self,
+        address: Any,
+        callback: NotificationCallback,
+        commitment: str = "confirmed",
+        encoding: str = "base64"
+    ) -> int:
+        """
+        Subscribe to changes of an account.
+
+        Args:
+            address: Account address
+            callback: Called with each notification's params
+            commitment: Commitment level
+            encoding: Account data encoding
+
+        Returns:
+            Subscription ID
+        """
+        params = [str(address), {"encoding": encoding, "commitment": commitment}]
+        return await self._subscribe("accountSubscribe", params, callback)
+
+    async def unsubscribe(self, subscription_id: int) -> None:
+        """
+        Remove a subscription. The connection is closed with the last one.
+
+        Args:
+            subscription_id: ID returned by a subscribe call
+        """
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            logger.warning("Subscription %s not found", subscription_id)
+            return
+
+        server_id = next(
+            (sid for sid, lid in self._server_ids.items() if lid == subscription_id),
+            None,
+        )
+        if server_id is not None:
+            del self._server_ids[server_id]
+            method = subscription[0].replace("Subscribe", "Unsubscribe")
+            try:
+                await self._send(method, [server_id])
+            except Exception as e:
+                logger.warning("Failed to send %s: %s", method, e)
+
+        if not self._subscriptions:
+            await self.close()
+
+    async def close(self) -> None:
+        """Close the connection and drop all subscriptions."""
+        self._running = False
+        self._subscriptions.clear()
+        task, self._reader_task = self._reader_task, None
+
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _subscribe(
+        self,
+        method: str,
+        params: List[Any],
+        callback: NotificationCallback
+    ) -> int:
+        """Record a subscription and send it if the hub is connected."""
+        subscription_id = self._next_id
+        self._next_id += 1
+        self._subscriptions[subscription_id] = (method, params, callback)
+
+        if self._reader_task is None or self._reader_task.done():
+            self._running = True
+            self._reader_task = asyncio.create_task(self._run())
+        elif self._ws is not None:
+            await self._send_subscribe(subscription_id)
+
+        return subscription_id
+
+    async def _run(self) -> None:
+        """Connection loop: (re)connect, re-subscribe and dispatch messages."""
+        backoff = self.INITIAL_BACKOFF
+
+        while self._running:
+            try:
+                async with websockets.connect(self.websocket_url) as websocket:
+                    self._ws = websocket
+                    self._server_ids.clear()
+                    self._pending.clear()
+
+                    # Snapshot before awaiting so concurrent subscribes are not sent twice
+                    for subscription_id in list(self._subscriptions):
+                        await self._send_subscribe(subscription_id)
+
+                    backoff = self.INITIAL_BACKOFF
+                    async for raw in websocket:
+                        await self._dispatch(json.loads(raw))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Websocket hub connection error: %s", e)
+            finally:
+                self._ws = None
+
+            if self._running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Route a decoded websocket message."""
+        if "id" in message:
+            # Response to a subscribe/unsubscribe request
+            subscription_id = self._pending.pop(message["id"], None)
+            if subscription_id is None:
+                return
+            if "error" in message:
+                logger.error("Subscription %s failed: %s", subscription_id, message["error"])
+            elif subscription_id in self._subscriptions:
+                self._server_ids[message["result"]] = subscription_id
+            return
+
+        params = message.get("params")
+        if not params:
+            return
+
+        subscription = self._subscriptions.get(self._server_ids.get(params.get("subscription")))
+        if subscription is None:
+            return
+
+        try:
+            result = subscription[2](params)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error("Error in subscription callback: %s", e)
+
+    async def _send_subscribe(self, subscription_id: int) -> None:
+        """Send the subscribe request for a recorded subscription."""
+        method, params, _ = self._subscriptions[subscription_id]
+        await self._send(method, params, subscription_id)
+
+    async def _send(
+        self,
+        method: str,
+        params: List[Any],
+        subscription_id: Optional[int] = None
+    ) -> int:
+        """Send a JSON-RPC request on the current connection."""
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        if subscription_id is not None:
+            # Registered before sending so the response can't race it
+            self._pending[request_id] = subscription_id
+        await self._ws.send(json.dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params,
+        }))
+        return request_id
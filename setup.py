@@ -1,53 +1,10 @@
 """
 Setup script for PumpDotFun SDK Python.
-"""
-
-from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+Package metadata lives in pyproject.toml; this stub only keeps legacy
+`python setup.py ...` invocations working.
+"""
 
-setup(
-    name="pumpdotfun-sdk-py",
-    version="1.0.0",
-    author="NHTS",
-    author_email="nguyen.h.thaisan@gmail.com",
-    description="Python SDK for interacting with PumpFun protocol on Solana",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/sannhtpd07870/py-pumpsdk",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Internet :: WWW/HTTP",
-        "Topic :: Office/Business :: Financial",
-    ],
-    python_requires=">=3.8",
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest>=6.0",
-            "pytest-asyncio>=0.18.0",
-            "black>=22.0.0",
-            "flake8>=4.0.0",
-            "mypy>=0.950",
-        ],
-    },
-    include_package_data=True,
-    package_data={
-        "pumpdotfun_sdk": ["idl/*.json"],
-    },
-)
+from setuptools import setup
 
+setup()
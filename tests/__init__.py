@@ -2,7 +2,7 @@
 Test package for PumpDotFun SDK.
 """
 
-import unittest
+import importlib.util
 import sys
 import os
 
@@ -11,15 +11,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
 def run_all_tests():
-    """Run all tests in the test suite."""
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(__file__)
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    """Run all tests in the test suite, in parallel when pytest-xdist is installed."""
+    import pytest
     
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    args = ["-q", os.path.dirname(__file__)]
+    if importlib.util.find_spec("xdist") is not None:
+        args[:0] = ["-n", "auto"]
     
-    return result.wasSuccessful()
+    return pytest.main(args) == 0
 
 
 if __name__ == '__main__':
@@ -1,38 +1,69 @@
-import logging
-import pathlib
-import pytest
-
-@pytest.fixture(scope="session", autouse=True)
-def configure_logging():
-    """Cấu hình log cho pytest: vừa in console vừa lưu file."""
-    logs_dir = pathlib.Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-
-    log_file = logs_dir / "pytest_run.log"
-
-    # Format log
-    log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
-
-    # Xóa handler cũ
-    root_logger = logging.getLogger()
-    for h in root_logger.handlers[:]:
-        root_logger.removeHandler(h)
-
-    # Handler console
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
-    root_logger.addHandler(console_handler)
-
-    # Handler file
-    file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
-    file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
-    root_logger.addHandler(file_handler)
-
-    root_logger.setLevel(logging.DEBUG)  # Ghi đầy đủ vào file
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-
-    logging.info("=== Pytest session started ===")
-    yield
-    logging.info("=== Pytest session finished ===")
+import logging
+import os
+import pathlib
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+import pytest
+
+
+def pytest_configure(config):
+    """Đăng ký marker để chọn nhóm test, ví dụ: pytest -m io -n 16."""
+    config.addinivalue_line("markers", "cpu: test tính toán thuần CPU, không cần mạng")
+    config.addinivalue_line("markers", "io: test gọi mạng thật (devnet)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Bỏ qua test devnet trừ khi đặt PUMPSDK_RUN_DEVNET=1, tránh tốn RTT khi chạy local."""
+    if os.environ.get("PUMPSDK_RUN_DEVNET") == "1":
+        return
+    skip_devnet = pytest.mark.skip(reason="đặt PUMPSDK_RUN_DEVNET=1 để chạy test devnet")
+    for item in items:
+        if "io" in item.keywords:
+            item.add_marker(skip_devnet)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def configure_logging():
+    """Cấu hình log cho pytest: vừa in console vừa lưu file."""
+    logs_dir = pathlib.Path("logs")
+    logs_dir.mkdir(exist_ok=True)
+
+    log_file = logs_dir / "pytest_run.log"
+
+    # Format log
+    log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    date_format = "%Y-%m-%d %H:%M:%S"
+
+    # Xóa handler cũ
+    root_logger = logging.getLogger()
+    for h in root_logger.handlers[:]:
+        root_logger.removeHandler(h)
+
+    # Handler console
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+
+    # Handler file, ghi theo bộ đệm 64KB và chỉ flush khi kết thúc
+    log_stream = open(log_file, "w", encoding="utf-8", buffering=65536)
+    file_handler = logging.StreamHandler(log_stream)
+    file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+
+    # Test chỉ đẩy record vào queue; format và ghi chạy trên thread nền
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+
+    # Mặc định INFO, đặt PUMPSDK_TEST_DEBUG=1 để ghi đầy đủ DEBUG
+    debug = os.environ.get("PUMPSDK_TEST_DEBUG") == "1"
+    root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    logging.info("=== Pytest session started ===")
+    yield
+    logging.info("=== Pytest session finished ===")
+
+    listener.stop()
+    log_stream.close()
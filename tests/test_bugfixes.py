@@ -3,29 +3,49 @@
 import unittest
 import asyncio
 import base64
+import os
+import tempfile
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from solana.publickey import PublicKey
 
-from pumpdotfun_sdk.utils import wait_for_confirmation
+from pumpdotfun_sdk.utils import wait_for_confirmation, ValidationError
 from pumpdotfun_sdk.events import EventManager
-from pumpdotfun_sdk.global_account import GlobalAccountManager, GlobalAccountData
+from pumpdotfun_sdk.global_account import (
+    GlobalAccountManager, GlobalAccountData, AccountMonitor, parse_many,
+    _GLOBAL_PDA, _KNOWN_PROGRAM_ID
+)
 
 
-class TestWaitForConfirmation(unittest.TestCase):
+class TestWaitForConfirmation(unittest.IsolatedAsyncioTestCase):
     """Ensure wait_for_confirmation handles string statuses."""
 
-    def test_confirmation_status_string(self):
-        async def run_test():
-            mock_client = AsyncMock()
-            status = SimpleNamespace(confirmation_status="finalized")
-            mock_client.get_signature_statuses.return_value = SimpleNamespace(value=[status])
-            return await wait_for_confirmation(mock_client, "sig", commitment="confirmed", timeout=1)
+    async def test_confirmation_status_string(self):
+        mock_client = AsyncMock()
+        status = SimpleNamespace(confirmation_status="finalized")
+        mock_client.get_signature_statuses.return_value = SimpleNamespace(value=[status])
 
-        result = asyncio.run(run_test())
+        result = await wait_for_confirmation(mock_client, "sig", commitment="confirmed", timeout=1)
         self.assertTrue(result)
 
+    async def test_confirmation_status_enum_and_unknown_commitment(self):
+        class Status:
+            def __str__(self):
+                return "TransactionConfirmationStatus.Processed"
+
+        mock_client = AsyncMock()
+        status = SimpleNamespace(confirmation_status=Status(), err=None)
+        mock_client.get_signature_statuses.return_value = SimpleNamespace(value=[status])
+
+        async def wait(commitment):
+            return await wait_for_confirmation(mock_client, "sig", commitment=commitment, timeout=0.01)
+
+        self.assertTrue(await wait("processed"))
+        self.assertFalse(await wait("finalized"))
+        with self.assertRaises(ValidationError):
+            await wait("final")
+
 
 class TestParseLogMessage(unittest.TestCase):
     """Ensure EventManager parses dict-based messages."""
@@ -37,11 +57,21 @@ class TestParseLogMessage(unittest.TestCase):
         self.assertIsNotNone(event_data)
         self.assertEqual(event_data["event_type"], "createEvent")
 
+    def test_log_accessor_specializes_and_falls_back(self):
+        manager = EventManager(AsyncMock(), "wss://example.com")
+        manager._parse_log_message({"result": {"logs": []}})
+        self.assertIsNotNone(manager._get_logs)
+
+        # A differently shaped message still parses through the general path
+        message = SimpleNamespace(result={"logs": ["Program log: CreateEvent"]})
+        event_data = manager._parse_log_message(message)
+        self.assertEqual(event_data["event_type"], "createEvent")
+
 
-class TestGlobalAccountManager(unittest.TestCase):
+class TestGlobalAccountManager(unittest.IsolatedAsyncioTestCase):
     """Ensure global account data handles base64 encoded responses."""
 
-    def test_base64_decoding(self):
+    async def test_base64_decoding(self):
         raw = b"\x00" * 200
         encoded = base64.b64encode(raw).decode("utf-8")
 
@@ -50,10 +80,92 @@ class TestGlobalAccountManager(unittest.TestCase):
         mock_client.get_account_info.return_value = account_info
 
         manager = GlobalAccountManager(mock_client, PublicKey("11111111111111111111111111111111"))
+        data = await manager.fetch_global_account_data(force_refresh=True)
+        self.assertIsInstance(data, GlobalAccountData)
+
+    def test_parse_many_matches_single_parse(self):
+        manager = GlobalAccountManager(AsyncMock(), PublicKey("11111111111111111111111111111111"))
+        buffers = [
+            bytes(8) + bytes([1]) + bytes(64) + (i).to_bytes(8, "little") * 4 + (100).to_bytes(2, "little")
+            for i in range(3)
+        ]
+
+        parsed = parse_many(buffers)
+
+        self.assertEqual(parsed, [manager._parse_global_account_data(raw) for raw in buffers])
+        self.assertEqual(parsed[2].token_total_supply, 2)
+
+    def test_known_program_uses_precomputed_pda(self):
+        manager = GlobalAccountManager(AsyncMock(), _KNOWN_PROGRAM_ID)
+        self.assertEqual(
+            _GLOBAL_PDA,
+            PublicKey.find_program_address([b"global"], _KNOWN_PROGRAM_ID)[0]
+        )
+        self.assertIs(manager.global_account_address, _GLOBAL_PDA)
+        self.assertIs(manager.get_global_account_address(), _GLOBAL_PDA)
+
+    async def test_persisted_cache_survives_new_manager(self):
+        encoded = base64.b64encode(b"\x00" * 200).decode("utf-8")
+
+        mock_client = AsyncMock()
+        account_info = SimpleNamespace(value=SimpleNamespace(data=[encoded, "base64"]))
+        mock_client.get_account_info.return_value = account_info
+        program_id = PublicKey("11111111111111111111111111111111")
 
-        async def run_test():
-            return await manager.fetch_global_account_data(force_refresh=True)
+        with tempfile.TemporaryDirectory() as cache_home, \
+                patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}):
+            manager = GlobalAccountManager(mock_client, program_id, persist_cache=True)
+            await manager.fetch_global_account_data()
+
+            # A fresh manager (new process) is served from disk
+            restarted = GlobalAccountManager(mock_client, program_id, persist_cache=True)
+            data = await restarted.fetch_global_account_data()
 
-        data = asyncio.run(run_test())
         self.assertIsInstance(data, GlobalAccountData)
+        self.assertEqual(mock_client.get_account_info.await_count, 1)
+
+    async def test_persisted_cache_is_per_endpoint(self):
+        encoded = base64.b64encode(b"\x00" * 200).decode("utf-8")
+        account_info = SimpleNamespace(value=SimpleNamespace(data=[encoded, "base64"]))
+        devnet, mainnet = AsyncMock(), AsyncMock()
+        devnet._provider = SimpleNamespace(endpoint_uri="https://api.devnet.solana.com")
+        mainnet._provider = SimpleNamespace(endpoint_uri="https://api.mainnet-beta.solana.com")
+        devnet.get_account_info.return_value = account_info
+        mainnet.get_account_info.return_value = account_info
+        program_id = PublicKey("11111111111111111111111111111111")
+
+        with tempfile.TemporaryDirectory() as cache_home, \
+                patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home}):
+            await GlobalAccountManager(devnet, program_id, persist_cache=True).fetch_global_account_data()
+            await GlobalAccountManager(mainnet, program_id, persist_cache=True).fetch_global_account_data()
+
+        # The mainnet manager is not seeded from the devnet file
+        self.assertEqual(mainnet.get_account_info.await_count, 1)
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        encoded = base64.b64encode(b"\x00" * 200).decode("utf-8")
+
+        mock_client = AsyncMock()
+        account_info = SimpleNamespace(value=SimpleNamespace(data=[encoded, "base64"]))
+        mock_client.get_account_info.return_value = account_info
+
+        manager = GlobalAccountManager(mock_client, PublicKey("11111111111111111111111111111111"))
+        results = await asyncio.gather(
+            *(manager.fetch_global_account_data() for _ in range(5))
+        )
+        self.assertEqual(mock_client.get_account_info.await_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_hub_monitor_stopped_during_initial_fetch(self):
+        hub = AsyncMock()
+        manager = GlobalAccountManager(AsyncMock(), PublicKey("11111111111111111111111111111111"))
+        monitor = AccountMonitor(manager, hub=hub)
+
+        async def fetch(force_refresh=False):
+            monitor.stop_monitoring()
+            return None
+
+        with patch.object(manager, "fetch_global_account_data", side_effect=fetch):
+            await asyncio.wait_for(monitor.start_monitoring(), timeout=1)
 
+        hub.subscribe_account.assert_not_awaited()
@@ -4,38 +4,56 @@ Unit tests for PumpDotFun SDK.
 
 import unittest
 import asyncio
+import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
+from solders.hash import Hash
+from solders.signature import Signature
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from pumpdotfun_sdk import PumpDotFunSDK
+from pumpdotfun_sdk.client import _decode_shortvec
 from pumpdotfun_sdk.types import (
     CreateTokenMetadata,
     PriorityFee,
     PumpFunEventType,
     BackendType,
+    BuyOrder,
 )
-from pumpdotfun_sdk.utils import validate_slippage, sol_to_lamports, format_sol_amount
-from pumpdotfun_sdk.bonding_curve import BondingCurveCalculator
+from pumpdotfun_sdk.utils import (
+    validate_slippage,
+    sol_to_lamports,
+    format_sol_amount,
+    create_metadata_uri,
+    PumpFunError,
+    NetworkError,
+    ValidationError,
+    TransactionError,
+)
+from pumpdotfun_sdk.events import EventManager
+from pumpdotfun_sdk.bonding_curve import BondingCurveCalculator, BondingCurveAccount
 from pumpdotfun_sdk.amm import AMMCalculator
 
 
 class TestPumpDotFunSDK(unittest.IsolatedAsyncioTestCase):
     """Test cases for main SDK functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.sdk = PumpDotFunSDK(
-            rpc_endpoint="https://api.devnet.solana.com",
-            websocket_endpoint="wss://api.devnet.solana.com"
-        )
-        self.test_keypair = Keypair()
-        self.test_mint = Keypair()
-        self.test_metadata = CreateTokenMetadata(
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once, without a real RPC client."""
+        with patch('pumpdotfun_sdk.client.AsyncClient', return_value=AsyncMock()):
+            cls.sdk = PumpDotFunSDK(
+                rpc_endpoint="https://api.devnet.solana.com",
+                websocket_endpoint="wss://api.devnet.solana.com"
+            )
+        cls.test_keypair = Keypair()
+        cls.test_mint = Keypair()
+        cls.test_metadata = CreateTokenMetadata(
             name="Test Token",
             symbol="TEST",
             description="A test token",
@@ -48,6 +66,21 @@ class TestPumpDotFunSDK(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(self.sdk.event_manager)
         self.assertEqual(self.sdk.commitment, "confirmed")
     
+    async def test_websocket_sharing_is_opt_in(self):
+        """Test SDK event listening only uses the shared hub when asked."""
+        self.assertFalse(self.sdk.event_manager.share_connection)
+        
+        with patch('pumpdotfun_sdk.client.AsyncClient', return_value=AsyncMock()):
+            sdk = PumpDotFunSDK(
+                rpc_endpoint="https://api.devnet.solana.com",
+                websocket_endpoint="wss://api.devnet.solana.com",
+                share_websocket=True
+            )
+        try:
+            self.assertTrue(sdk.event_manager.share_connection)
+        finally:
+            await sdk.close()
+    
     def test_event_listener_management(self):
         """Test event listener add/remove functionality."""
         def test_callback(event, slot, signature):
@@ -101,6 +134,147 @@ class TestPumpDotFunSDK(unittest.IsolatedAsyncioTestCase):
         mock_portal.assert_called()
 
 
+class TestMessageTemplateCache(unittest.TestCase):
+    """Test cases for the pre-serialized message template cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one SDK for the class, without a real RPC client."""
+        with patch('pumpdotfun_sdk.client.AsyncClient', return_value=AsyncMock()):
+            cls.sdk = PumpDotFunSDK(rpc_endpoint="https://api.devnet.solana.com")
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sdk._msg_template_cache.clear()
+        self.signer = Keypair()
+
+    def test_decode_shortvec(self):
+        """Test compact-u16 decoding."""
+        self.assertEqual(_decode_shortvec(bytes([0x05]), 0), (5, 1))
+        self.assertEqual(_decode_shortvec(bytes([0x80, 0x01]), 0), (128, 2))
+        self.assertEqual(_decode_shortvec(bytes([0xff, 0xff, 0x03]), 0), (65535, 3))
+
+    def test_template_reused_and_blockhash_patched(self):
+        """Test that repeat sends reuse the compiled template."""
+        signer_key = bytes(self.signer.public_key)
+        message = bytes([1, 0, 0, 1]) + signer_key + bytes(32) + b"ix"
+        template = (message, 36, (signer_key,))
+        key = (signer_key, bytes(32), "buy")
+
+        transaction = SimpleNamespace(instructions=[self._instruction(b"ix")])
+
+        with patch.object(
+            PumpDotFunSDK, "_compile_message_template", return_value=template
+        ) as mock_compile:
+            first = self.sdk._sign_from_template(key, transaction, [self.signer], b"\x01" * 32)
+            second = self.sdk._sign_from_template(key, transaction, [self.signer], b"\x02" * 32)
+
+        mock_compile.assert_called_once()
+        self.assertEqual(first[0], 1)
+        self.assertEqual(first[65 + 36:65 + 68], b"\x01" * 32)
+        self.assertEqual(second[65 + 36:65 + 68], b"\x02" * 32)
+        self.assertEqual(first[-2:], b"ix")
+
+    def test_template_recompiled_when_amount_changes(self):
+        """Test that a changed instruction never reuses a stale message."""
+        signer_key = bytes(self.signer.public_key)
+        key = (signer_key, bytes(32), "buy")
+        header = bytes([1, 0, 0, 1]) + signer_key + bytes(32)
+
+        def compile_template(transaction, signers, blockhash):
+            return (header + transaction.instructions[0].data, 36, (signer_key,))
+
+        with patch.object(
+            PumpDotFunSDK, "_compile_message_template", side_effect=compile_template
+        ) as mock_compile:
+            first = self.sdk._sign_from_template(
+                key, SimpleNamespace(instructions=[self._instruction(b"amount=1")]),
+                [self.signer], b"\x01" * 32
+            )
+            second = self.sdk._sign_from_template(
+                key, SimpleNamespace(instructions=[self._instruction(b"amount=2")]),
+                [self.signer], b"\x01" * 32
+            )
+
+        self.assertEqual(mock_compile.call_count, 2)
+        self.assertEqual(first[-8:], b"amount=1")
+        self.assertEqual(second[-8:], b"amount=2")
+
+    def _instruction(self, data):
+        """Minimal instruction with one signer account."""
+        return SimpleNamespace(
+            program_id=PumpDotFunSDK.PUMP_FUN_PROGRAM_ID,
+            data=data,
+            keys=[SimpleNamespace(pubkey=self.signer.public_key, is_signer=True, is_writable=True)],
+        )
+
+
+class TestBatchTrading(unittest.IsolatedAsyncioTestCase):
+    """Test cases for batched buy/sell orders."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with patch('pumpdotfun_sdk.client.AsyncClient', return_value=AsyncMock()):
+            self.sdk = PumpDotFunSDK(rpc_endpoint="https://api.devnet.solana.com")
+        self.sdk.rpc_client.get_latest_blockhash.return_value = Mock(
+            value=Mock(blockhash=Hash.default())
+        )
+        self.mint = Keypair().public_key
+        self.curve = BondingCurveAccount(self.sdk._parse_bonding_curve_data(b""))
+
+    async def asyncTearDown(self):
+        """Close the SDK's HTTP client."""
+        await self.sdk.close()
+
+    async def test_empty_orders_make_no_requests(self):
+        """Test that empty order lists return without any RPC call."""
+        with patch.object(self.sdk, "_rpc_batch", AsyncMock()) as mock_batch, \
+                patch.object(self.sdk, "_get_bonding_curve_accounts", AsyncMock()) as mock_curves:
+            self.assertEqual(await self.sdk.buy_many([]), [])
+            self.assertEqual(await self.sdk.sell_many([]), [])
+
+        mock_batch.assert_not_awaited()
+        mock_curves.assert_not_awaited()
+        self.sdk.rpc_client.get_latest_blockhash.assert_not_awaited()
+        self.sdk.rpc_client.get_multiple_accounts.assert_not_awaited()
+
+    async def test_buy_many_shares_round_trips(self):
+        """Test that buy_many fetches and sends once for all orders."""
+        orders = [
+            BuyOrder(buyer=Keypair(), mint=self.mint, buy_amount_sol=0.1),
+            BuyOrder(buyer=Keypair(), mint=self.mint, buy_amount_sol=-1.0),
+            BuyOrder(buyer=Keypair(), mint=self.mint, buy_amount_sol=0.2),
+        ]
+        signature = str(Signature.default())
+
+        with patch.object(
+            self.sdk, "_get_bonding_curve_accounts",
+            AsyncMock(return_value={bytes(self.mint): self.curve}),
+        ) as mock_curves, patch.object(
+            self.sdk, "_rpc_batch",
+            AsyncMock(return_value=[
+                {"id": 0, "result": signature},
+                {"id": 1, "error": {"message": "blockhash not found"}},
+            ]),
+        ) as mock_batch, patch(
+            "pumpdotfun_sdk.client.wait_for_confirmations",
+            AsyncMock(return_value=[True]),
+        ):
+            results = await self.sdk.buy_many(orders)
+
+        mock_curves.assert_awaited_once()
+        mock_batch.assert_awaited_once()
+        self.assertEqual(len(mock_batch.await_args.args[0]), 2)
+        self.sdk.rpc_client.get_latest_blockhash.assert_awaited_once()
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].signature, signature)
+        self.assertFalse(results[1].success)
+        self.assertIn("must be positive", results[1].error)
+        self.assertFalse(results[2].success)
+        self.assertIn("blockhash not found", results[2].error)
+
+
 class TestUtilityFunctions(unittest.TestCase):
     """Test cases for utility functions."""
     
@@ -121,8 +295,6 @@ class TestUtilityFunctions(unittest.TestCase):
     
     def test_metadata_uri_creation(self):
         """Test metadata URI creation."""
-        from pumpdotfun_sdk.utils import create_metadata_uri
-        
         metadata = CreateTokenMetadata(
             name="Test Token",
             symbol="TEST",
@@ -138,6 +310,7 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertIn("@test", uri)
 
 
+@pytest.mark.cpu
 class TestBondingCurve(unittest.TestCase):
     """Test cases for bonding curve calculations."""
     
@@ -154,6 +327,19 @@ class TestBondingCurve(unittest.TestCase):
         self.assertGreater(tokens_out, 0)
         self.assertIsInstance(tokens_out, int)
     
+    def test_batch_buy_prices_match_single_quotes(self):
+        """Test batched buy quotes equal individual quotes."""
+        sol_amounts = [1, 1_000_000_000, 85_000_000_000]
+        
+        quotes = BondingCurveCalculator.get_buy_prices(sol_amounts, 0, 800_000_000_000_000)
+        
+        self.assertEqual(quotes, [
+            BondingCurveCalculator.get_buy_price(amount, 0, 800_000_000_000_000)
+            for amount in sol_amounts
+        ])
+        with self.assertRaises(PumpFunError):
+            BondingCurveCalculator.get_buy_prices([1, 0], 0, 1000)
+    
     def test_sell_price_calculation(self):
         """Test sell price calculation."""
         token_amount = 1_000_000_000_000  # 1M tokens
@@ -177,8 +363,6 @@ class TestBondingCurve(unittest.TestCase):
     
     def test_invalid_inputs(self):
         """Test handling of invalid inputs."""
-        from pumpdotfun_sdk.utils import PumpFunError
-        
         with self.assertRaises(PumpFunError):
             BondingCurveCalculator.get_buy_price(-1, 1000, 1000)
         
@@ -186,6 +370,7 @@ class TestBondingCurve(unittest.TestCase):
             BondingCurveCalculator.get_sell_price(-1, 1000, 1000)
 
 
+@pytest.mark.cpu
 class TestAMM(unittest.TestCase):
     """Test cases for AMM functionality."""
     
@@ -233,8 +418,6 @@ class TestEventHandling(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        from pumpdotfun_sdk.events import EventManager
-        
         self.mock_client = Mock()
         self.event_manager = EventManager(
             self.mock_client,
@@ -318,24 +501,18 @@ class TestErrorHandling(unittest.TestCase):
     
     def test_network_error_handling(self):
         """Test network error handling."""
-        from pumpdotfun_sdk.utils import NetworkError
-        
         # Test that NetworkError can be raised and caught
         with self.assertRaises(NetworkError):
             raise NetworkError("Test network error")
     
     def test_validation_error_handling(self):
         """Test validation error handling."""
-        from pumpdotfun_sdk.utils import ValidationError
-        
         # Test that ValidationError can be raised and caught
         with self.assertRaises(ValidationError):
             raise ValidationError("Test validation error")
     
     def test_transaction_error_handling(self):
         """Test transaction error handling."""
-        from pumpdotfun_sdk.utils import TransactionError
-        
         # Test that TransactionError can be raised and caught
         with self.assertRaises(TransactionError):
             raise TransactionError("Test transaction error")
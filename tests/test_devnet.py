@@ -1,44 +1,54 @@
 import unittest
-import asyncio
-import base58
+try:
+    from based58 import b58decode
+except ImportError:
+    from base58 import b58decode
+import pytest
 
-from solana.rpc.async_api import AsyncClient
 from solana.publickey import PublicKey
 from solana.keypair import Keypair
 
 from pumpdotfun_sdk import PumpDotFunSDK
 from pumpdotfun_sdk.types import CreateTokenMetadata
+from pumpdotfun_sdk.utils import get_shared_rpc_client, close_shared_rpc_clients
 
 
 DEVNET_PUBLIC_KEY = "GkgkJyLRB5gWHxvv1MrAUefLAF7S9c17593sYnwXAdwp"
 DEVNET_SECRET_BASE58 = "5QYZkjJ1PShm8YeUaxiwWvFzfazJ3irpmwwJh9zJ6aHdg3vDDvhoeS1v1hKQxuRfCu94R3gVCVVWMLjoYss5MM94"
+_DEVNET_SECRET_BYTES = b58decode(DEVNET_SECRET_BASE58)
 
 
-class TestDevnetConnectivity(unittest.TestCase):
+@pytest.mark.io
+class TestDevnetConnectivity(unittest.IsolatedAsyncioTestCase):
     """Verify that the Solana devnet is reachable."""
 
-    def test_get_balance(self):
-        async def run_test():
-            client = AsyncClient("https://api.devnet.solana.com")
-            resp = await client.get_balance(PublicKey(DEVNET_PUBLIC_KEY))
-            await client.close()
-            return resp.value
+    async def asyncSetUp(self):
+        self.client = get_shared_rpc_client("https://api.devnet.solana.com")
+
+    async def asyncTearDown(self):
+        # Shared clients are bound to this test's event loop
+        await close_shared_rpc_clients()
 
-        balance = asyncio.run(run_test())
-        self.assertIsInstance(balance, int)
+    async def test_get_balance(self):
+        resp = await self.client.get_balance(PublicKey(DEVNET_PUBLIC_KEY))
+        self.assertIsInstance(resp.value, int)
 
 
+@pytest.mark.io
 class TestDevnetIntegration(unittest.IsolatedAsyncioTestCase):
     """Run a simulated create-buy-sell flow on devnet."""
 
     async def asyncSetUp(self):
-        self.sdk = PumpDotFunSDK("https://api.devnet.solana.com")
-        secret = base58.b58decode(DEVNET_SECRET_BASE58)
-        self.creator = Keypair.from_secret_key(secret)
+        self.sdk = PumpDotFunSDK(
+            "https://api.devnet.solana.com",
+            rpc_client=get_shared_rpc_client("https://api.devnet.solana.com"),
+        )
+        self.creator = Keypair.from_secret_key(_DEVNET_SECRET_BYTES)
         self.mint = Keypair()
 
     async def asyncTearDown(self):
         await self.sdk.close()
+        await close_shared_rpc_clients()
 
     async def test_create_buy_sell_flow(self):
         metadata = CreateTokenMetadata(
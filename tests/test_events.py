@@ -4,6 +4,11 @@ Unit tests for event handling functionality.
 
 import unittest
 import asyncio
+import base64
+import dataclasses
+import struct
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 import sys
@@ -11,10 +16,35 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from pumpdotfun_sdk.events import EventManager
+from pumpdotfun_sdk.websocket_hub import WebSocketHub
+from pumpdotfun_sdk._event_parser import TRADE_EVENT_DISCRIMINATOR, parse_event
 from pumpdotfun_sdk.types import PumpFunEventType, CreateEvent, TradeEvent, CompleteEvent
+from pumpdotfun_sdk.utils import PumpFunError
 from solana.publickey import PublicKey
 
 
+_ParseCase = namedtuple("_ParseCase", "kind log_data parser event_type expected_keys")
+
+# Text event logs and the fields each parser must return
+_PARSE_CASES = (
+    _ParseCase(
+        "create", "CreateEvent: mint=ABC123, name=TestToken, symbol=TST",
+        "_parse_create_event", PumpFunEventType.CREATE_EVENT,
+        ("mint", "name", "symbol", "uri", "user", "timestamp"),
+    ),
+    _ParseCase(
+        "trade", "TradeEvent: mint=ABC123, user=DEF456, buy=true",
+        "_parse_trade_event", PumpFunEventType.TRADE_EVENT,
+        ("mint", "user", "is_buy", "sol_amount", "token_amount", "timestamp"),
+    ),
+    _ParseCase(
+        "complete", "CompleteEvent: mint=ABC123, user=DEF456",
+        "_parse_complete_event", PumpFunEventType.COMPLETE_EVENT,
+        ("mint", "user", "timestamp"),
+    ),
+)
+
+
 class TestEventManager(unittest.TestCase):
     """Test cases for EventManager class."""
     
@@ -84,6 +114,9 @@ class TestEventManager(unittest.TestCase):
         
         # Verify it's removed
         self.assertNotIn(listener_id, self.event_manager.listeners)
+        self.assertEqual(
+            self.event_manager._by_type[PumpFunEventType.CREATE_EVENT.value], []
+        )
         
         # Test removing non-existent listener (should not raise error)
         self.event_manager.remove_listener(999)
@@ -100,56 +133,62 @@ class TestEventParsing(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_client = Mock()
-        self.event_manager = EventManager(self.mock_client, "wss://test.com")
+        # Parsing never touches the client, so a plain namespace stands in
+        self.event_manager = EventManager(SimpleNamespace(), "wss://test.com")
     
-    def test_parse_create_event(self):
-        """Test parsing create events."""
-        log_data = "CreateEvent: mint=ABC123, name=TestToken, symbol=TST"
-        result = self.event_manager._parse_create_event(log_data)
-        
-        self.assertEqual(result["event_type"], PumpFunEventType.CREATE_EVENT.value)
-        self.assertIn("mint", result)
-        self.assertIn("name", result)
-        self.assertIn("symbol", result)
-        self.assertIn("uri", result)
-        self.assertIn("user", result)
-        self.assertIn("timestamp", result)
-        self.assertIsInstance(result["timestamp"], int)
-    
-    def test_parse_trade_event(self):
-        """Test parsing trade events."""
-        log_data = "TradeEvent: mint=ABC123, user=DEF456, buy=true"
-        result = self.event_manager._parse_trade_event(log_data)
-        
-        self.assertEqual(result["event_type"], PumpFunEventType.TRADE_EVENT.value)
-        self.assertIn("mint", result)
-        self.assertIn("user", result)
-        self.assertIn("is_buy", result)
-        self.assertIn("sol_amount", result)
-        self.assertIn("token_amount", result)
-        self.assertIn("timestamp", result)
-        self.assertIsInstance(result["is_buy"], bool)
-    
-    def test_parse_complete_event(self):
-        """Test parsing complete events."""
-        log_data = "CompleteEvent: mint=ABC123, user=DEF456"
-        result = self.event_manager._parse_complete_event(log_data)
-        
-        self.assertEqual(result["event_type"], PumpFunEventType.COMPLETE_EVENT.value)
-        self.assertIn("mint", result)
-        self.assertIn("user", result)
-        self.assertIn("timestamp", result)
+    def test_parse_events(self):
+        """Test parsing create, trade and complete events."""
+        for case in _PARSE_CASES:
+            with self.subTest(kind=case.kind):
+                result = getattr(self.event_manager, case.parser)(case.log_data)
+                
+                self.assertEqual(result["event_type"], case.event_type.value)
+                for key in case.expected_keys:
+                    self.assertIn(key, result)
+                self.assertIsInstance(result["timestamp"], int)
+                if "is_buy" in case.expected_keys:
+                    self.assertIsInstance(result["is_buy"], bool)
+    
+    def test_parse_text_event_fields(self):
+        """Test field values are extracted from text event logs."""
+        create = self.event_manager._parse_create_event(
+            "CreateEvent: mint=ABC123, name=TestToken, symbol=TST"
+        )
+        trade = self.event_manager._parse_trade_event(
+            "TradeEvent: mint=ABC123, user=DEF456, buy=false, sol_amount=5, token_amount=7"
+        )
+        
+        self.assertEqual((create["mint"], create["name"], create["symbol"]), ("ABC123", "TestToken", "TST"))
+        self.assertEqual(trade["user"], "DEF456")
+        self.assertFalse(trade["is_buy"])
+        self.assertEqual((trade["sol_amount"], trade["token_amount"]), (5, 7))
+    
+    def test_parse_text_event_space_separated_and_malformed(self):
+        """Test values end at whitespace and bad numbers fall back to defaults."""
+        spaced = self.event_manager._parse_trade_event("TradeEvent sol_amount=1000 token_amount=5")
+        with_unit = self.event_manager._parse_trade_event("TradeEvent: sol_amount=12 lamports")
+        malformed = self.event_manager._parse_trade_event(
+            "TradeEvent: mint=ABC123, sol_amount=abc, token_amount=7"
+        )
+        
+        self.assertEqual((spaced["sol_amount"], spaced["token_amount"]), (1000, 5))
+        self.assertEqual(with_unit["sol_amount"], 12)
+        self.assertEqual((malformed["mint"], malformed["sol_amount"]), ("ABC123", 0))
+        self.assertEqual(malformed["token_amount"], 7)
+        
+        # The whole log line still parses into an event
+        message = {"result": {"logs": ["Program log: TradeEvent: sol_amount=abc, token_amount=7"]}}
+        event_data = self.event_manager._parse_log_message(message)
+        self.assertEqual(event_data["token_amount"], 7)
     
     def test_parse_log_message_with_create_event(self):
         """Test parsing log messages containing create events."""
-        mock_message = Mock()
-        mock_message.result = {
+        mock_message = SimpleNamespace(result={
             "logs": [
                 "Program log: CreateEvent data here",
                 "Other log entry"
             ]
-        }
+        })
         
         with patch.object(self.event_manager, '_parse_create_event') as mock_parse:
             mock_parse.return_value = {"event_type": "createEvent", "test": "data"}
@@ -159,23 +198,57 @@ class TestEventParsing(unittest.TestCase):
             self.assertIsNotNone(result)
             mock_parse.assert_called_once()
     
+    def test_parse_log_message_with_program_data(self):
+        """Test decoding an Anchor TradeEvent from a Program data line."""
+        mint = bytes(PublicKey("11111111111111111111111111111112"))
+        user = bytes(PublicKey("11111111111111111111111111111113"))
+        payload = TRADE_EVENT_DISCRIMINATOR + struct.pack(
+            '<32sQQ?32sq', mint, 1000000000, 2000000, True, user, 1234567890
+        )
+        message = {"result": {"logs": [
+            "Program log: Instruction: Buy",
+            "Program data: " + base64.b64encode(payload).decode()
+        ]}}
+        
+        result = self.event_manager._parse_log_message(message)
+        
+        self.assertIsInstance(result, TradeEvent)
+        self.assertEqual(str(result.mint), "11111111111111111111111111111112")
+        self.assertEqual(result.sol_amount, 1000000000)
+        self.assertEqual(result.token_amount, 2000000)
+        self.assertTrue(result.is_buy)
+        self.assertEqual(result.timestamp, 1234567890)
+        
+        # Truncated or unknown payloads are ignored
+        self.assertIsNone(parse_event(payload[:20]))
+        self.assertIsNone(parse_event(b"\x00" * 64))
+    
     def test_parse_log_message_no_events(self):
         """Test parsing log messages with no events."""
-        mock_message = Mock()
-        mock_message.result = {
+        mock_message = SimpleNamespace(result={
             "logs": [
                 "Regular program log",
                 "Another regular log"
             ]
-        }
+        })
         
         result = self.event_manager._parse_log_message(mock_message)
         self.assertIsNone(result)
     
+    def test_parse_log_message_skips_lines_without_event(self):
+        """Test non-event lines never reach the event matchers."""
+        message = {"result": {"logs": [
+            "Program 6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P invoke [1]",
+            "Program log: Instruction: Buy",
+        ]}}
+        
+        with patch('pumpdotfun_sdk.events._match_event_kind') as mock_match:
+            self.assertIsNone(self.event_manager._parse_log_message(message))
+            mock_match.assert_not_called()
+    
     def test_parse_log_message_invalid_format(self):
         """Test parsing malformed log messages."""
-        mock_message = Mock()
-        mock_message.result = None
+        mock_message = SimpleNamespace(result=None)
         
         result = self.event_manager._parse_log_message(mock_message)
         self.assertIsNone(result)
@@ -236,6 +309,10 @@ class TestEventObjectCreation(unittest.TestCase):
         self.assertEqual(event_obj.sol_amount, 1000000000)
         self.assertEqual(event_obj.token_amount, 1000000000000)
         self.assertEqual(event_obj.timestamp, 1234567890)
+        
+        # Event records are immutable
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            event_obj.sol_amount = 0
     
     def test_create_complete_event_object(self):
         """Test creating CompleteEvent objects."""
@@ -255,10 +332,49 @@ class TestEventObjectCreation(unittest.TestCase):
         self.assertIsInstance(event_obj.user, PublicKey)
         self.assertEqual(event_obj.timestamp, 1234567890)
     
+    def test_repeated_addresses_share_public_keys(self):
+        """Test mints and users seen before reuse the cached PublicKey."""
+        event_data = {
+            "mint": "11111111111111111111111111111112",
+            "user": "11111111111111111111111111111113",
+            "timestamp": 1234567890
+        }
+        
+        first = self.event_manager._create_event_object(
+            PumpFunEventType.COMPLETE_EVENT.value, event_data
+        )
+        second = self.event_manager._create_event_object(
+            PumpFunEventType.COMPLETE_EVENT.value, dict(event_data)
+        )
+        
+        self.assertIs(first.mint, second.mint)
+        self.assertIs(first.user, second.user)
+        self.assertEqual(first.mint, PublicKey(event_data["mint"]))
+    
+    def test_create_event_object_from_raw_keys(self):
+        """Test raw 32-byte keys build the same PublicKeys as base58 strings."""
+        mint = PublicKey("11111111111111111111111111111112")
+        user = PublicKey("11111111111111111111111111111113")
+        event_data = {"mint": bytes(mint), "user": bytes(user), "timestamp": 1234567890}
+        
+        event = self.event_manager._create_event_object(
+            PumpFunEventType.COMPLETE_EVENT.value, event_data
+        )
+        
+        self.assertEqual(event.mint, mint)
+        self.assertEqual(event.user, user)
+        
+        # bytearrays (unhashable) go through the same cache as bytes
+        event_data = {"mint": bytearray(bytes(mint)), "user": bytearray(bytes(user)), "timestamp": 0}
+        from_bytearray = self.event_manager._create_event_object(
+            PumpFunEventType.COMPLETE_EVENT.value, event_data
+        )
+        
+        self.assertIs(from_bytearray.mint, event.mint)
+        self.assertIs(from_bytearray.user, event.user)
+    
     def test_create_unknown_event_object(self):
         """Test creating objects for unknown event types."""
-        from pumpdotfun_sdk.utils import PumpFunError
-        
         event_data = {"test": "data"}
         
         with self.assertRaises(PumpFunError):
@@ -368,6 +484,102 @@ class TestEventProcessing(unittest.IsolatedAsyncioTestCase):
             
             # Should not raise exception even if callback fails
             await self.event_manager._process_message(mock_message)
+    
+    async def test_batch_listener_receives_flushed_events(self):
+        """Test batch listeners get all queued events in one call."""
+        batches = []
+        self.event_manager.add_listener(
+            PumpFunEventType.TRADE_EVENT, batches.append, batch=True
+        )
+        self.event_manager.add_listener(PumpFunEventType.TRADE_EVENT, self.record_callback)
+        
+        with patch.object(self.event_manager, '_parse_log_message') as mock_parse:
+            mock_parse.return_value = {
+                "event_type": PumpFunEventType.TRADE_EVENT.value,
+                "mint": "11111111111111111111111111111112",
+                "user": "11111111111111111111111111111113",
+                "is_buy": True,
+                "sol_amount": 1,
+                "token_amount": 2,
+                "timestamp": 1234567890,
+                "slot": 12345,
+                "signature": "test_signature"
+            }
+            
+            await self.event_manager._process_message(Mock(), flush=False)
+            await self.event_manager._process_message(Mock(), flush=False)
+            self.assertEqual(batches, [])
+            
+            self.event_manager.flush()
+        
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 2)
+        self.assertIsInstance(batches[0][0][0], TradeEvent)
+        self.assertTrue(self.callback_called)
+    
+    async def test_async_callback_awaited_and_errors_contained(self):
+        """Test coroutine callbacks are awaited and their errors logged."""
+        received = []
+        
+        async def async_callback(event, slot, signature):
+            received.append(event)
+        
+        async def failing_callback(event, slot, signature):
+            raise Exception("Callback error")
+        
+        self.event_manager.add_listener(PumpFunEventType.TRADE_EVENT, failing_callback)
+        self.event_manager.add_listener(PumpFunEventType.TRADE_EVENT, async_callback)
+        payload = TRADE_EVENT_DISCRIMINATOR + struct.pack(
+            '<32sQQ?32sq', bytes(32), 1, 2, True, bytes(32), 1234567890
+        )
+        message = {"result": {"logs": [
+            "Program data: " + base64.b64encode(payload).decode()
+        ]}}
+        
+        with self.assertLogs('pumpdotfun_sdk.events', level='ERROR'):
+            await self.event_manager._process_message(message)
+        
+        self.assertEqual(len(received), 1)
+        self.assertIsInstance(received[0], TradeEvent)
+    
+    async def test_program_data_event_dispatched_without_dict(self):
+        """Test binary-decoded events reach listeners as built."""
+        self.event_manager.add_listener(PumpFunEventType.TRADE_EVENT, self.record_callback)
+        payload = TRADE_EVENT_DISCRIMINATOR + struct.pack(
+            '<32sQQ?32sq', bytes(32), 1, 2, False, bytes(32), 1234567890
+        )
+        message = {"result": {"logs": [
+            "Program data: " + base64.b64encode(payload).decode()
+        ]}}
+        
+        with patch.object(self.event_manager, '_create_event_object') as mock_create:
+            await self.event_manager._process_message(message)
+            mock_create.assert_not_called()
+        
+        self.assertIsInstance(self.callback_event, TradeEvent)
+        self.assertFalse(self.callback_event.is_buy)
+    
+    async def test_mint_filter_skips_other_mints(self):
+        """Test listeners with a mint filter only see their mints."""
+        watched = []
+        self.event_manager.add_listener(
+            PumpFunEventType.COMPLETE_EVENT,
+            lambda event, slot, signature: watched.append(event),
+            mint_filter=["11111111111111111111111111111112"]
+        )
+        self.event_manager.add_listener(PumpFunEventType.COMPLETE_EVENT, self.record_callback)
+        
+        with patch.object(self.event_manager, '_parse_log_message') as mock_parse:
+            mock_parse.return_value = {
+                "event_type": PumpFunEventType.COMPLETE_EVENT.value,
+                "mint": "11111111111111111111111111111113",
+                "user": "11111111111111111111111111111113",
+                "timestamp": 1234567890
+            }
+            await self.event_manager._process_message(Mock())
+        
+        self.assertEqual(watched, [])
+        self.assertTrue(self.callback_called)
 
 
 class TestEventManagerLifecycle(unittest.IsolatedAsyncioTestCase):
@@ -378,17 +590,21 @@ class TestEventManagerLifecycle(unittest.IsolatedAsyncioTestCase):
         self.mock_client = Mock()
         self.event_manager = EventManager(self.mock_client, "wss://test.com")
     
-    def test_stop_listening(self):
+    async def test_stop_listening(self):
         """Test stopping event listening."""
         # Set up as if listening
+        listen_task = asyncio.create_task(asyncio.sleep(60))
+        websocket_connection = AsyncMock()
         self.event_manager.is_listening = True
-        self.event_manager.listen_task = Mock()
-        self.event_manager.websocket_connection = Mock()
+        self.event_manager.listen_task = listen_task
+        self.event_manager.websocket_connection = websocket_connection
         
-        self.event_manager.stop_listening()
+        await self.event_manager.stop_listening()
         
         self.assertFalse(self.event_manager.is_listening)
-        self.event_manager.listen_task.cancel.assert_called_once()
+        self.assertTrue(listen_task.cancelled())
+        self.assertIsNone(self.event_manager.listen_task)
+        websocket_connection.close.assert_awaited_once()
     
     @patch('pumpdotfun_sdk.events.connect')
     async def test_listen_loop_connection_error(self, mock_connect):
@@ -399,6 +615,112 @@ class TestEventManagerLifecycle(unittest.IsolatedAsyncioTestCase):
         # Should not raise exception
         await self.event_manager._listen_loop()
     
+    @patch('pumpdotfun_sdk.events.random.uniform', return_value=0.25)
+    @patch('pumpdotfun_sdk.events.asyncio.sleep', new_callable=AsyncMock)
+    @patch('pumpdotfun_sdk.events.connect')
+    async def test_listen_loop_reconnects_with_backoff(self, mock_connect, mock_sleep, mock_uniform):
+        """Test listen loop retries in place with growing, jittered delays."""
+        mock_connect.side_effect = Exception("Connection failed")
+        self.event_manager.is_listening = True
+        
+        async def stop_after_three(delay):
+            if mock_sleep.await_count >= 3:
+                self.event_manager.is_listening = False
+        
+        mock_sleep.side_effect = stop_after_three
+        
+        with patch.object(self.event_manager, 'start_listening') as mock_start:
+            await self.event_manager._listen_loop()
+            mock_start.assert_not_called()
+        
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [1.25, 2.25, 4.25])
+        mock_uniform.assert_called_with(0, 0.5)
+        self.assertIsNone(self.event_manager.websocket_connection)
+    
+    @patch('pumpdotfun_sdk.events.asyncio.sleep', new_callable=AsyncMock)
+    @patch('pumpdotfun_sdk.events.connect')
+    async def test_listen_loop_logs_disconnect_as_warning(self, mock_connect, mock_sleep):
+        """Test connection drops are logged as warnings without a traceback."""
+        mock_connect.side_effect = OSError("Connection reset")
+        self.event_manager.is_listening = True
+        
+        async def stop(delay):
+            self.event_manager.is_listening = False
+        
+        mock_sleep.side_effect = stop
+        
+        with self.assertLogs('pumpdotfun_sdk.events', level='WARNING') as logs:
+            await self.event_manager._listen_loop()
+        
+        self.assertEqual([r.levelname for r in logs.records], ['WARNING'])
+        self.assertIsNone(logs.records[0].exc_info)
+        delay = mock_sleep.await_args.args[0]
+        self.assertTrue(1.0 <= delay <= 1.5)
+    
+    @patch('pumpdotfun_sdk.events.connect')
+    async def test_listen_loop_drains_burst_before_flush(self, mock_connect):
+        """Test frames that arrive together are processed then flushed once."""
+        class FakeWebSocket:
+            logs_subscribe = AsyncMock()
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                return False
+            
+            async def __aiter__(self):
+                for message in ("first", "second"):
+                    yield message
+        
+        mock_connect.return_value = FakeWebSocket()
+        self.event_manager.is_listening = True
+        
+        async def process(message, flush=True):
+            if message == "second":
+                self.event_manager.is_listening = False
+        
+        with patch.object(self.event_manager, '_process_message', side_effect=process) as mock_process, \
+                patch.object(self.event_manager, 'flush') as mock_flush:
+            await self.event_manager._listen_loop()
+        
+        self.assertEqual(
+            [c.args for c in mock_process.await_args_list], [("first",), ("second",)]
+        )
+        mock_flush.assert_called_once()
+    
+    @patch('pumpdotfun_sdk.events.random.uniform', return_value=0.25)
+    @patch('pumpdotfun_sdk.events.asyncio.sleep', new_callable=AsyncMock)
+    @patch('pumpdotfun_sdk.events.connect')
+    async def test_listen_loop_backs_off_on_clean_close(self, mock_connect, mock_sleep, mock_uniform):
+        """Test a server that closes without sending anything is not hammered."""
+        class ClosingWebSocket:
+            logs_subscribe = AsyncMock()
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                return False
+            
+            async def __aiter__(self):
+                return
+                yield
+        
+        mock_connect.side_effect = lambda url: ClosingWebSocket()
+        self.event_manager.is_listening = True
+        
+        async def stop_after_three(delay):
+            if mock_sleep.await_count >= 3:
+                self.event_manager.is_listening = False
+        
+        mock_sleep.side_effect = stop_after_three
+        
+        await self.event_manager._listen_loop()
+        
+        self.assertEqual(mock_connect.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [1.25, 2.25, 4.25])
+    
     def test_multiple_listeners_same_event(self):
         """Test multiple listeners for the same event type."""
         callback1_called = False
@@ -420,6 +742,76 @@ class TestEventManagerLifecycle(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(self.event_manager.listeners), 2)
 
 
+
+class TestWebSocketHub(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the shared websocket hub."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.hub = WebSocketHub("wss://api.devnet.solana.com")
+        self.hub._ws = AsyncMock()
+        # Pretend the reader is already running
+        self.hub._reader_task = Mock(done=Mock(return_value=False))
+    
+    async def test_dispatch_by_subscription_id(self):
+        """Notifications reach the callback of the matching subscription."""
+        logs_callback = Mock()
+        account_callback = AsyncMock()
+        
+        logs_id = await self.hub.subscribe_logs(["program"], logs_callback)
+        account_id = await self.hub.subscribe_account("account", account_callback)
+        
+        # Confirm both subscriptions with server ids 10 and 11
+        await self.hub._dispatch({"jsonrpc": "2.0", "id": 1, "result": 10})
+        await self.hub._dispatch({"jsonrpc": "2.0", "id": 2, "result": 11})
+        self.assertEqual(self.hub._server_ids, {10: logs_id, 11: account_id})
+        
+        params = {"subscription": 11, "result": {"value": {}}}
+        await self.hub._dispatch({"method": "accountNotification", "params": params})
+        
+        account_callback.assert_awaited_once_with(params)
+        logs_callback.assert_not_called()
+    
+    async def test_unsubscribe_sends_server_id(self):
+        """Unsubscribing sends the matching *Unsubscribe request."""
+        subscription_id = await self.hub.subscribe_logs(["program"], Mock())
+        await self.hub.subscribe_account("account", Mock())
+        await self.hub._dispatch({"jsonrpc": "2.0", "id": 1, "result": 42})
+        
+        await self.hub.unsubscribe(subscription_id)
+        
+        sent = self.hub._ws.send.await_args.args[0]
+        self.assertIn('"logsUnsubscribe"', sent)
+        self.assertIn("[42]", sent)
+        self.assertNotIn(subscription_id, self.hub._subscriptions)
+    
+    async def test_event_manager_uses_hub(self):
+        """EventManager subscribes through the hub instead of connecting."""
+        hub = Mock()
+        hub.subscribe_logs = AsyncMock(return_value=7)
+        event_manager = EventManager(Mock(), "wss://api.devnet.solana.com", hub=hub)
+        
+        await event_manager.start_listening()
+        
+        hub.subscribe_logs.assert_awaited_once()
+        self.assertEqual(event_manager.hub_subscription_id, 7)
+        self.assertIsNone(event_manager.listen_task)
+    
+    @patch.object(WebSocketHub, 'subscribe_logs', new_callable=AsyncMock)
+    async def test_managers_share_connection_per_url(self, mock_subscribe):
+        """Managers with share_connection subscribe through one hub per URL."""
+        url = "wss://api.devnet.solana.com"
+        first = EventManager(Mock(), url, share_connection=True)
+        second = EventManager(Mock(), url, share_connection=True)
+        
+        await first.start_listening()
+        await second.start_listening()
+        
+        self.assertIs(first._subscribed_hub, second._subscribed_hub)
+        self.assertIs(first._subscribed_hub, WebSocketHub.shared(url))
+        self.assertEqual(mock_subscribe.await_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
 
@@ -3,6 +3,8 @@ Unit tests for utility functions.
 """
 
 import unittest
+import asyncio
+import base64
 import json
 import time
 from unittest.mock import Mock, AsyncMock, patch
@@ -18,8 +20,14 @@ from pumpdotfun_sdk.utils import (
     format_token_amount,
     sol_to_lamports,
     calculate_slippage_amount,
+    calculate_slippage_amount_batch,
+    sol_to_lamports_batch,
+    format_sol_amount_batch,
     encode_instruction_data,
     decode_account_data,
+    decode_account_bytes,
+    wait_for_confirmation,
+    wait_for_confirmations,
     PumpFunError,
     TransactionError,
     ValidationError,
@@ -140,6 +148,14 @@ class TestConversionUtils(unittest.TestCase):
         lamports = sol_to_lamports(original_sol)
         converted_back = format_sol_amount(lamports)
         self.assertEqual(original_sol, converted_back)
+    
+    def test_batch_conversions_match_scalar(self):
+        """Test batch conversions agree with the scalar functions."""
+        sol_amounts = [0, 0.5, 2.5, 0.001]
+        lamports = [0, 1_000_000, 2_500_000_000]
+        
+        self.assertEqual(sol_to_lamports_batch(sol_amounts), [sol_to_lamports(a) for a in sol_amounts])
+        self.assertEqual(format_sol_amount_batch(lamports), [format_sol_amount(a) for a in lamports])
 
 
 class TestSlippageUtils(unittest.TestCase):
@@ -174,6 +190,25 @@ class TestSlippageUtils(unittest.TestCase):
         # Small amounts
         result = calculate_slippage_amount(1, 500, is_minimum=True)
         self.assertEqual(result, 0)  # Rounds down to 0
+        
+        # Large raw amounts stay exact
+        result = calculate_slippage_amount(10**18 + 1, 100, is_minimum=False)
+        self.assertEqual(result, (10**18 + 1) * 10100 // 10000)
+        
+        # Float amounts still give an int
+        result = calculate_slippage_amount(1000.0, 500, is_minimum=True)
+        self.assertEqual(result, 950)
+        self.assertIsInstance(result, int)
+    
+    def test_calculate_slippage_amount_batch(self):
+        """Test batch slippage matches the scalar calculation."""
+        amounts = [1, 1000, 10**18 + 1]
+        
+        for is_minimum in (True, False):
+            self.assertEqual(
+                calculate_slippage_amount_batch(amounts, 500, is_minimum),
+                [calculate_slippage_amount(a, 500, is_minimum) for a in amounts]
+            )
 
 
 class TestDataEncodingUtils(unittest.TestCase):
@@ -195,11 +230,17 @@ class TestDataEncodingUtils(unittest.TestCase):
         decoded_data = json.loads(decoded_str)
         self.assertEqual(decoded_data["instruction"], "buy")
         self.assertEqual(decoded_data["amount"], 1000000000)
+        
+        # Integers wider than 64 bits encode with or without orjson
+        encoded = encode_instruction_data({"amount": 2**70})
+        self.assertEqual(json.loads(encoded), {"amount": 2**70})
+        
+        # Without orjson the bytes are exactly the baseline json.dumps output
+        with patch('pumpdotfun_sdk.utils.orjson', None):
+            self.assertEqual(encode_instruction_data(data), json.dumps(data).encode('utf-8'))
     
     def test_decode_account_data(self):
         """Test account data decoding."""
-        import base64
-        
         # Create test data
         test_data = b"test account data"
         encoded_data = base64.b64encode(test_data).decode('ascii')
@@ -207,12 +248,27 @@ class TestDataEncodingUtils(unittest.TestCase):
         decoded = decode_account_data(encoded_data)
         self.assertIn("raw_data", decoded)
         self.assertEqual(decoded["raw_data"], test_data)
+        
+        # Bytes input decodes the same way
+        decoded = decode_account_data(encoded_data.encode('ascii'))
+        self.assertEqual(decoded["raw_data"], test_data)
+    
+    def test_decode_account_bytes(self):
+        """Test account data decoding straight to bytes."""
+        encoded_data = base64.b64encode(b"test account data").decode('ascii')
+        
+        self.assertEqual(decode_account_bytes(encoded_data, "base64"), b"test account data")
+        with self.assertRaises(ValidationError):
+            decode_account_bytes(encoded_data, "base58")
     
     def test_decode_account_data_invalid(self):
         """Test account data decoding with invalid input."""
         # Invalid base64
         decoded = decode_account_data("invalid_base64!")
         self.assertEqual(decoded, {})
+        
+        # Neither text nor bytes
+        self.assertEqual(decode_account_data(None), {})
 
 
 class TestErrorClasses(unittest.TestCase):
@@ -252,13 +308,12 @@ class TestAsyncUtils(unittest.IsolatedAsyncioTestCase):
     @patch('pumpdotfun_sdk.utils.asyncio.sleep')
     async def test_wait_for_confirmation_success(self, mock_sleep):
         """Test successful transaction confirmation."""
-        from pumpdotfun_sdk.utils import wait_for_confirmation
-        
         # Mock successful confirmation
         mock_client = AsyncMock()
         mock_response = Mock()
         mock_response.value = [Mock()]
         mock_response.value[0].confirmation_status = "finalized"
+        mock_response.value[0].err = None
         mock_client.get_signature_statuses.return_value = mock_response
         
         result = await wait_for_confirmation(
@@ -270,8 +325,6 @@ class TestAsyncUtils(unittest.IsolatedAsyncioTestCase):
     @patch('pumpdotfun_sdk.utils.asyncio.sleep')
     async def test_wait_for_confirmation_timeout(self, mock_sleep):
         """Test transaction confirmation timeout."""
-        from pumpdotfun_sdk.utils import wait_for_confirmation
-        
         # Mock no confirmation
         mock_client = AsyncMock()
         mock_response = Mock()
@@ -287,8 +340,6 @@ class TestAsyncUtils(unittest.IsolatedAsyncioTestCase):
     @patch('pumpdotfun_sdk.utils.asyncio.sleep')
     async def test_wait_for_confirmation_error(self, mock_sleep):
         """Test transaction confirmation with RPC error."""
-        from pumpdotfun_sdk.utils import wait_for_confirmation
-        
         # Mock RPC error
         mock_client = AsyncMock()
         mock_client.get_signature_statuses.side_effect = Exception("RPC Error")
@@ -298,6 +349,76 @@ class TestAsyncUtils(unittest.IsolatedAsyncioTestCase):
         )
         
         self.assertFalse(result)
+    
+    @patch('pumpdotfun_sdk.utils.asyncio.sleep')
+    async def test_wait_for_confirmation_backoff_and_failure(self, mock_sleep):
+        """Test polling backs off and stops once the transaction fails."""
+        pending = Mock()
+        pending.value = [None]
+        failed = Mock()
+        failed.value = [Mock(err={"InstructionError": [0, "Custom"]})]
+        mock_client = AsyncMock()
+        mock_client.get_signature_statuses.side_effect = [pending, pending, failed]
+        
+        result = await wait_for_confirmation(
+            mock_client, "test_signature", "confirmed", timeout=5
+        )
+        
+        self.assertFalse(result)
+        self.assertEqual(mock_client.get_signature_statuses.await_count, 3)
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.05)
+        self.assertAlmostEqual(delays[1], 0.075)
+
+    
+    async def test_wait_for_confirmation_bounds_stalled_rpc(self):
+        """Test a status request that never answers is cut off at the timeout."""
+        async def stall(signatures):
+            await asyncio.Event().wait()
+        
+        mock_client = AsyncMock()
+        mock_client.get_signature_statuses.side_effect = stall
+        
+        result = await asyncio.wait_for(
+            wait_for_confirmation(mock_client, "test_signature", "confirmed", timeout=0.1),
+            timeout=5
+        )
+        
+        self.assertFalse(result)
+    
+    async def test_concurrent_waiters_share_status_request(self):
+        """Test concurrent confirmations are looked up in one RPC call."""
+        status = Mock(err=None, confirmation_status="confirmed")
+        mock_client = AsyncMock()
+        mock_client.get_signature_statuses.return_value = Mock(value=[status, status])
+        
+        results = await asyncio.gather(
+            wait_for_confirmation(mock_client, "sig_a", "confirmed", timeout=5),
+            wait_for_confirmation(mock_client, "sig_b", "confirmed", timeout=5)
+        )
+        
+        self.assertEqual(results, [True, True])
+        mock_client.get_signature_statuses.assert_awaited_once_with(["sig_a", "sig_b"])
+    
+    async def test_failed_lookup_does_not_drop_later_signatures(self):
+        """Test one failing status lookup leaves the rest of the round intact."""
+        lookups = []
+        
+        async def lookup(signature, max_wait=None):
+            lookups.append(signature)
+            if signature == "sig_bad":
+                raise RuntimeError("lookup failed")
+            return Mock(err=None, confirmation_status="confirmed")
+        
+        batcher = Mock(lookup=lookup)
+        with patch('pumpdotfun_sdk.utils.get_signature_batcher', return_value=batcher):
+            results = await wait_for_confirmations(
+                AsyncMock(), ["sig_bad", "sig_good"], "confirmed", timeout=0.2
+            )
+        
+        self.assertEqual(results, [False, True])
+        self.assertEqual(lookups.count("sig_good"), 1)
 
 
 class TestUtilityIntegration(unittest.TestCase):